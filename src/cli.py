@@ -1,12 +1,18 @@
 """Command Line Interface for the Prometheus Forensic Tool (F7)."""
 
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import typer
 
 from src.logger import configure_logging, get_logger
-from src.main import run_pipeline
+
+# Quantidade de linhas verbosas acumuladas antes de escrever no stderr.
+PROGRESS_FLUSH_LINES = 32
+# Atualizações da barra acumuladas antes de redesenhar (por quantidade ou tempo).
+PROGRESS_UPDATE_BATCH = 32
+PROGRESS_UPDATE_INTERVAL = 0.1
 
 app = typer.Typer(
     help="Prometheus Forensic Tool CLI",
@@ -27,7 +33,8 @@ def main(
 ) -> None:
     """Callback global usado para inicializar configurações compartilhadas."""
 
-    logger = configure_logging(verbose=verbose)
+    # Execução pontual: sem rotação, o log é escrito uma única vez por processo.
+    logger = configure_logging(verbose=verbose, rotate=False)
     ctx.obj = {"verbose": verbose, "logger": logger}
 
 
@@ -49,6 +56,18 @@ def scan(
         "-o",
         help="Arquivo de saída JSON consolidado.",
     ),
+    progress: bool = typer.Option(
+        True,
+        "--progress/--no-progress",
+        help="Exibe a barra de progresso por arquivo .ufdr.",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=0,
+        help="Processos paralelos (um arquivo .ufdr por processo); 0 usa todos os núcleos.",
+    ),
 ) -> None:
     """Orquestra a execução completa da ferramenta."""
 
@@ -57,7 +76,12 @@ def scan(
     verbose: bool = ctx.obj.get("verbose", False) if ctx.obj else False
     logger = get_logger()
     logger.debug(
-        "CLI scan requested with input=%s config=%s output=%s verbose=%s", input, config_path, output_path, verbose
+        "CLI scan requested with input=%s config=%s output=%s verbose=%s progress=%s",
+        input,
+        config_path,
+        output_path,
+        verbose,
+        progress,
     )
 
     # Mostrar informações iniciais
@@ -100,106 +124,106 @@ def scan(
     )
 
     progress_state: Dict[str, tuple[object, object]] = {}
-    
+    # Por UFDR: [atualizações pendentes, instante do último redesenho].
+    progress_pending: Dict[str, List[float]] = {}
+    # Linhas verbosas acumuladas para reduzir escritas individuais no stderr.
+    pending_lines: List[str] = []
+    # Nome de exibição por UFDR, calculado uma vez por arquivo.
+    ufdr_names: Dict[str, str] = {}
+
     # Flag para verificar se algum arquivo foi encontrado
     files_found = False
 
+    def queue_line(message: str, **style: object) -> None:
+        pending_lines.append(typer.style(message, **style))
+
+    def flush_lines() -> None:
+        if pending_lines:
+            typer.echo("\n".join(pending_lines), err=True)
+            pending_lines.clear()
+
     def handle_progress(event: Dict[str, object]) -> None:
         event_type = event.get("type")
         path_str = event.get("path")
         if not event_type or not path_str:
             return
 
-        ufdr_name = Path(path_str).name
-        full_path = Path(path_str)
+        ufdr_name = ufdr_names.get(path_str)
+        if ufdr_name is None:
+            ufdr_name = ufdr_names[path_str] = Path(path_str).name
 
         if event_type == "ufdr-start":
             total = int(event.get("textual_total") or 0)
             if verbose:
-                typer.secho(
-                    f"\n{'='*80}",
-                    fg=typer.colors.CYAN,
-                    err=True,
-                )
-                typer.secho(
-                    f"📦 Processando UFDR: {ufdr_name}",
-                    fg=typer.colors.CYAN,
-                    bold=True,
-                    err=True,
-                )
-                typer.secho(
-                    f"   Caminho completo: {full_path}",
-                    fg=typer.colors.WHITE,
-                    err=True,
-                )
+                queue_line(f"\n{'='*80}", fg=typer.colors.CYAN)
+                queue_line(f"📦 Processando UFDR: {ufdr_name}", fg=typer.colors.CYAN, bold=True)
+                queue_line(f"   Caminho completo: {path_str}", fg=typer.colors.WHITE)
+                flush_lines()
             if total > 0:
                 bar_cm = typer.progressbar(length=total, label=f"{ufdr_name} (textual)" if verbose else "Processando...")
                 progress = bar_cm.__enter__()
                 progress_state[path_str] = (bar_cm, progress)
+                progress_pending[path_str] = [0, time.monotonic()]
                 if verbose:
-                    typer.secho(
+                    queue_line(
                         f"   📄 Encontrados {total} arquivo(s) textual(is) para processar",
                         fg=typer.colors.BLUE,
-                        err=True,
                     )
             else:
                 if verbose:
-                    typer.secho(
+                    queue_line(
                         f"   ⚠️  Nenhum arquivo textual elegível para processamento.",
                         fg=typer.colors.YELLOW,
-                        err=True,
                     )
+            flush_lines()
         elif event_type == "text-progress":
             state = progress_state.get(path_str)
-            index = int(event.get("index") or 0)
-            total = int(event.get("total") or 0)
-            engine = event.get("engine") or event.get("stage") or ""
-            member = event.get("member", "")
-
             if state:
                 _, progress = state
                 stage = event.get("stage")
                 if stage in {"done", "skip"}:
-                    progress.update(1)
+                    pending = progress_pending[path_str]
+                    pending[0] += 1
+                    now = time.monotonic()
+                    if pending[0] >= PROGRESS_UPDATE_BATCH or now - pending[1] >= PROGRESS_UPDATE_INTERVAL:
+                        progress.update(int(pending[0]))
+                        pending[0] = 0
+                        pending[1] = now
 
             # Mostrar detalhes do arquivo sendo processado apenas se verbose
             if verbose:
-                member_name = Path(member).name if member else f"arquivo {index}"
-                typer.secho(
-                    f"   [{index}/{total}] Processando: {member_name}",
-                    fg=typer.colors.BRIGHT_BLUE,
-                    err=True,
-                )
+                index = int(event.get("index") or 0)
+                total = int(event.get("total") or 0)
+                engine = event.get("engine") or event.get("stage") or ""
+                member = event.get("member", "")
+                member_name = member.rsplit("/", 1)[-1] if member else f"arquivo {index}"
+                queue_line(f"   [{index}/{total}] Processando: {member_name}", fg=typer.colors.BRIGHT_BLUE)
                 if engine:
-                    typer.secho(
-                        f"       → Engine: {engine}",
-                        fg=typer.colors.WHITE,
-                        err=True,
-                    )
+                    queue_line(f"       → Engine: {engine}", fg=typer.colors.WHITE)
+                if len(pending_lines) >= PROGRESS_FLUSH_LINES:
+                    flush_lines()
         elif event_type == "ufdr-complete":
+            ufdr_names.pop(path_str, None)
+            flush_lines()
             state = progress_state.pop(path_str, None)
+            pending = progress_pending.pop(path_str, None)
             if state:
-                bar_cm, _ = state
+                bar_cm, progress = state
+                if pending and pending[0]:
+                    progress.update(int(pending[0]))
                 bar_cm.__exit__(None, None, None)
             if verbose:
-                typer.secho(
-                    f"✅ Concluído: {ufdr_name}",
-                    fg=typer.colors.GREEN,
-                    bold=True,
-                    err=True,
-                )
-                typer.secho(
-                    f"{'='*80}\n",
-                    fg=typer.colors.CYAN,
-                    err=True,
-                )
+                queue_line(f"✅ Concluído: {ufdr_name}", fg=typer.colors.GREEN, bold=True)
+                queue_line(f"{'='*80}\n", fg=typer.colors.CYAN)
+                flush_lines()
+
+    # Importado aqui para que --help e erros de argumento não carreguem o pipeline.
+    from src.main import run_pipeline
 
     try:
         # Verificar se há arquivos antes de processar
         from src.scanner import UFDRScanner
-        scanner = UFDRScanner(input)
-        scan_results = scanner.scan()
-        ufdr_paths = [result.path for result in scan_results]
+        ufdr_paths = UFDRScanner.list_paths(UFDRScanner(input).scan())
         
         if not ufdr_paths:
             typer.secho(
@@ -226,14 +250,18 @@ def scan(
             input_dir=input,
             config_path=config_path if config_path else Path(),
             output_path=output_path,
-            progress_callback=handle_progress,
+            progress_callback=handle_progress if progress else None,
+            ufdr_paths=ufdr_paths,
+            max_workers=workers or None,
         )
     except NotImplementedError as exc:  # pragma: no cover - placeholder behaviour
         typer.secho(str(exc), fg=typer.colors.YELLOW)
         logger.warning("Pipeline ainda não implementado: %s", exc)
         raise typer.Exit(code=1) from exc
     finally:
+        flush_lines()
         # Garante que barras pendentes sejam encerradas em caso de erro inesperado.
+        progress_pending.clear()
         while progress_state:
             _, (bar_cm, _) = progress_state.popitem()
             bar_cm.__exit__(None, None, None)
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from dataclasses import dataclass
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Iterator, Literal, Mapping, Sequence
 
-from src.database_reader import UFDRDatabaseReader
-from src.extractor import UFDRExtractor, UFDRMember
-from src.text_extractor import MissingDependencyError, TextExtractor
+from src.database_reader import SQLITE_EXTENSIONS, UFDRDatabaseReader
+from src.extractor import UFDRExtractor, UFDRMember, member_suffix
+from src.text_extractor import MissingDependencyError, TextExtractionResult, TextExtractor
 
 logger = logging.getLogger(__name__)
 
-TEXTUAL_EXTENSIONS = {
+# Environment variables overriding the number and kind of text extraction workers.
+WORKERS_ENV_VAR = "PROMETHEUS_WORKERS"
+WORKER_MODE_ENV_VAR = "PROMETHEUS_WORKER_MODE"
+
+WorkerMode = Literal["thread", "process"]
+
+TEXTUAL_EXTENSIONS = frozenset({
     ".txt",
     ".csv",
     ".tsv",
@@ -39,9 +51,9 @@ TEXTUAL_EXTENSIONS = {
     ".odp",
     ".ods",
     ".log",
-}
+})
 
-IMAGE_EXTENSIONS = {
+IMAGE_EXTENSIONS = frozenset({
     ".png",
     ".jpg",
     ".jpeg",
@@ -52,10 +64,110 @@ IMAGE_EXTENSIONS = {
     ".bmp",
     ".gif",
     ".webp",
+})
+
+# Suffix -> file_type table built once at import; anything missing is "binary".
+_SUFFIX_TO_TYPE: dict[str, str] = {
+    **{suffix: "text" for suffix in TEXTUAL_EXTENSIONS},
+    **{suffix: "document" for suffix in (".pdf", ".doc", ".docx", ".ppt", ".pptx")},
+    **{suffix: "spreadsheet" for suffix in (".xls", ".xlsx", ".ods")},
+    **{suffix: "email" for suffix in (".eml", ".msg")},
+    ".ics": "calendar",
+    ".vcf": "contact",
+    **{suffix: "image" for suffix in IMAGE_EXTENSIONS},
+    **{suffix: "database" for suffix in SQLITE_EXTENSIONS},
 }
+_DATABASE_SUFFIXES = frozenset(suffix for suffix, kind in _SUFFIX_TO_TYPE.items() if kind == "database")
+
+
+_shared_text_extractor: TextExtractor | None = None
+_shared_text_extractor_lock = threading.Lock()
+
+
+def _get_shared_text_extractor() -> TextExtractor:
+    """Return the process-wide TextExtractor, creating it on first use."""
+
+    global _shared_text_extractor
+    with _shared_text_extractor_lock:
+        if _shared_text_extractor is None:
+            _shared_text_extractor = TextExtractor()
+        return _shared_text_extractor
+
+
+def _default_worker_count() -> int:
+    """Return the text extraction worker count (``PROMETHEUS_WORKERS`` or CPU based)."""
+
+    raw = os.environ.get(WORKERS_ENV_VAR)
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Valor inválido em %s: %r; usando o padrão", WORKERS_ENV_VAR, raw)
+    return min(8, os.cpu_count() or 1)
+
+
+def _default_worker_mode() -> WorkerMode:
+    """Return the text extraction worker kind (``PROMETHEUS_WORKER_MODE``, default thread)."""
+
+    raw = (os.environ.get(WORKER_MODE_ENV_VAR) or "thread").strip().lower()
+    if raw not in ("thread", "process"):
+        logger.warning("Valor inválido em %s: %r; usando threads", WORKER_MODE_ENV_VAR, raw)
+        return "thread"
+    return raw  # type: ignore[return-value]
+
+
+# Archive opened by the current worker process; replaced when the archive changes.
+_worker_archive: UFDRExtractor | None = None
 
 
-@dataclass(frozen=True)
+# Process pool shared by every navigator, so worker start-up is paid once per session.
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def _init_text_worker() -> None:
+    # Build the worker's TextExtractor up front rather than on its first task.
+    _get_shared_text_extractor()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, recreating it when the size changes or it broke."""
+
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        pool = _process_pool
+        if pool is None or _process_pool_workers != max_workers or getattr(pool, "_broken", False):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_text_worker)
+            _process_pool = pool
+            _process_pool_workers = max_workers
+        return pool
+
+
+@atexit.register
+def _shutdown_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True, cancel_futures=True)
+            _process_pool = None
+
+
+def _extract_text_in_worker(ufdr_path: str, member_name: str) -> TextExtractionResult:
+    """Extract one member inside a worker process (must stay importable/picklable)."""
+
+    global _worker_archive
+    if _worker_archive is None or str(_worker_archive.ufdr_path) != ufdr_path:
+        if _worker_archive is not None:
+            _worker_archive.close()
+        _worker_archive = UFDRExtractor(ufdr_path)
+    with _worker_archive.open_member(member_name) as stream:
+        return _get_shared_text_extractor().extract(stream, source_name=member_name)
+
+
+@dataclass(frozen=True, slots=True)
 class EvidencePayload:
     """Resulting artifact produced by the navigator."""
 
@@ -68,7 +180,7 @@ class EvidencePayload:
     modified: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextualProgressEvent:
     """Progress information for textual extraction inside an UFDR."""
 
@@ -79,40 +191,86 @@ class TextualProgressEvent:
     engine: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NavigatorPlan:
     """Partition of UFDR members for processing."""
 
-    members: Sequence[UFDRMember]
     database_members: Sequence[UFDRMember]
     textual_members: Sequence[UFDRMember]
+    # Re-enumerates the whole archive on demand; planning only builds the partitions.
+    member_source: Callable[[], Iterator[UFDRMember]] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def members(self) -> list[UFDRMember]:
+        """Every member of the archive, enumerated lazily."""
+
+        if self.member_source is None:
+            return [*self.database_members, *self.textual_members]
+        return list(self.member_source())
 
 
 class UFDRContentNavigator:
     """Coordinate ingestion of UFDR content, prioritizing databases."""
 
-    def __init__(self, ufdr_path: Path | str, allowed_extensions: set[str] | None = None) -> None:
+    def __init__(
+        self,
+        ufdr_path: Path | str,
+        allowed_extensions: set[str] | None = None,
+        *,
+        max_workers: int | None = None,
+        worker_mode: WorkerMode | None = None,
+    ) -> None:
         self._extractor = UFDRExtractor(ufdr_path)
         self._database_reader = UFDRDatabaseReader(self._extractor)
-        self._text_extractor = TextExtractor()
         # If allowed_extensions is None, use all extensions (backward compatibility)
         # Otherwise, only process files with extensions in the allowed set
         self._allowed_extensions = allowed_extensions
+        # Level checked once per navigator to keep debug calls out of the per-member path.
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Text extraction workers; 1 keeps it sequential. Processes sidestep the GIL
+        # for pure-Python parsers such as pdfminer.
+        self._max_workers = max_workers if max_workers is not None else _default_worker_count()
+        self._worker_mode = worker_mode or _default_worker_mode()
+
+    def close(self) -> None:
+        """Release the archive handle held by the underlying extractor."""
+
+        self._extractor.close()
+
+    def __enter__(self) -> UFDRContentNavigator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def _text_extractor(self) -> TextExtractor:
+        # Shared across navigators and only created once a textual member is processed.
+        return _get_shared_text_extractor()
 
     def plan_processing(self) -> NavigatorPlan:
         """Return the members partitioned by type for progress planning."""
 
-        members = list(self._extractor.iter_members())
-        database_members = [member for member in members if self._is_database(member)]
-        textual_members = [
-            member
-            for member in members
-            if not member.is_dir and self._is_textual(member)
-        ]
+        database_members: list[UFDRMember] = []
+        textual_members: list[UFDRMember] = []
+        allowed = self._allowed_extensions
+        categorize = _SUFFIX_TO_TYPE.get
+        wanted = _SUFFIX_TO_TYPE.keys() if allowed is None else _DATABASE_SUFFIXES | allowed
+
+        # Single pass over the archive; members outside the wanted suffixes are
+        # skipped before they are built. Databases take priority over textual files.
+        for member in self._extractor.iter_members_filtered(lambda name: member_suffix(name) in wanted):
+            if member.is_dir:
+                continue
+            if categorize(member.suffix) == "database":
+                database_members.append(member)
+            else:
+                textual_members.append(member)
+
         return NavigatorPlan(
-            members=members,
             database_members=database_members,
             textual_members=textual_members,
+            member_source=self._extractor.iter_members,
         )
 
     def collect_payloads(
@@ -125,70 +283,127 @@ class UFDRContentNavigator:
         plan = plan or self.plan_processing()
         database_members = plan.database_members
         textual_members = plan.textual_members
+        results: Iterator[tuple[EvidencePayload, str] | None] | None = None
 
-        if database_members:
-            logger.info(
-                "Processando %d banco(s) de dados em %s",
-                len(database_members),
-                self._extractor.ufdr_path,
-            )
-            for member in database_members:
-                yield from self._collect_database_rows(member)
-
-        if textual_members:
+        try:
             if database_members:
                 logger.info(
-                    "Processando também %d arquivo(s) textual(is)/imagem(ns) em %s",
-                    len(textual_members),
+                    "Processando %d banco(s) de dados em %s",
+                    len(database_members),
                     self._extractor.ufdr_path,
                 )
-            else:
-                logger.info(
-                    "Nenhum banco de dados encontrado; processando %d arquivos textuais/imagens em %s",
-                    len(textual_members),
-                    self._extractor.ufdr_path,
-                )
-
-            total = len(textual_members)
-            for index, member in enumerate(textual_members, start=1):
-                if progress_callback:
-                    progress_callback(
-                        TextualProgressEvent(
-                            member=member,
-                            index=index,
-                            total=total,
-                            stage="start",
-                            engine=None,
-                        )
+                for member in database_members:
+                    yield from self._collect_database_rows(member)
+
+            if textual_members:
+                if database_members:
+                    logger.info(
+                        "Processando também %d arquivo(s) textual(is)/imagem(ns) em %s",
+                        len(textual_members),
+                        self._extractor.ufdr_path,
                     )
-
-                payload_result = self._collect_text_payload(member)
-                if payload_result is not None:
-                    payload, engine = payload_result
-                    if progress_callback:
-                        progress_callback(
-                            TextualProgressEvent(
-                                member=member,
-                                index=index,
-                                total=total,
-                                stage="done",
-                                engine=engine,
-                            )
-                        )
-                    yield payload
                 else:
+                    logger.info(
+                        "Nenhum banco de dados encontrado; processando %d arquivos textuais/imagens em %s",
+                        len(textual_members),
+                        self._extractor.ufdr_path,
+                    )
+
+                total = len(textual_members)
+                results = self._iter_text_results(textual_members)
+                for index, member in enumerate(textual_members, start=1):
                     if progress_callback:
                         progress_callback(
                             TextualProgressEvent(
                                 member=member,
                                 index=index,
                                 total=total,
-                                stage="skip",
+                                stage="start",
                                 engine=None,
                             )
                         )
-        elif not database_members:
-            logger.info("Nenhum banco de dados ou arquivo textual identificado em %s", self._extractor.ufdr_path)
+
+                    payload_result = next(results)
+                    if payload_result is not None:
+                        payload, engine = payload_result
+                        if progress_callback:
+                            progress_callback(
+                                TextualProgressEvent(
+                                    member=member,
+                                    index=index,
+                                    total=total,
+                                    stage="done",
+                                    engine=engine,
+                                )
+                            )
+                        yield payload
+                    else:
+                        if progress_callback:
+                            progress_callback(
+                                TextualProgressEvent(
+                                    member=member,
+                                    index=index,
+                                    total=total,
+                                    stage="skip",
+                                    engine=None,
+                                )
+                            )
+            elif not database_members:
+                logger.info("Nenhum banco de dados ou arquivo textual identificado em %s", self._extractor.ufdr_path)
+        finally:
+            # Stop pending extractions before releasing the archive handle they read from.
+            if results is not None:
+                results.close()
+            self._extractor.close()
+
+    def _iter_text_results(
+        self, members: Sequence[UFDRMember]
+    ) -> Iterator[tuple[EvidencePayload, str] | None]:
+        """Yield text extraction results in member order.
+
+        With more than one worker, extraction runs ahead on a thread pool (one per
+        call) or the shared process pool while keeping at most ``2 * max_workers``
+        members in flight.
+        """
+
+        if self._max_workers <= 1 or len(members) <= 1:
+            for member in members:
+                yield self._collect_text_payload(member)
+            return
+
+        use_processes = self._worker_mode == "process"
+        executor: Executor
+        if use_processes:
+            executor = _get_process_pool(self._max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="prometheus-text")
+        ufdr_path = str(self._extractor.ufdr_path)
+
+        def submit(member: UFDRMember) -> Future[TextExtractionResult] | None:
+            if member.size == 0:
+                return None
+            if use_processes:
+                return executor.submit(_extract_text_in_worker, ufdr_path, member.name)
+            return executor.submit(self._extract_member_text, member)
+
+        pending: deque[tuple[UFDRMember, Future[TextExtractionResult] | None]] = deque()
+        try:
+            members_iter = iter(members)
+            pending.extend((member, submit(member)) for member in islice(members_iter, 2 * self._max_workers))
+            while pending:
+                member, future = pending.popleft()
+                next_member = next(members_iter, None)
+                if next_member is not None:
+                    pending.append((next_member, submit(next_member)))
+                yield self._collect_text_payload(member, future)
+        finally:
+            if use_processes:
+                # The pool outlives this archive; only drop the work still queued for it.
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+            else:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def _collect_database_rows(self, member: UFDRMember) -> Iterator[EvidencePayload]:
         for row in self._database_reader.iter_rows(member):
@@ -205,12 +420,28 @@ class UFDRContentNavigator:
                 modified=member.modified,
             )
 
-    def _collect_text_payload(self, member: UFDRMember) -> tuple[EvidencePayload, str] | None:
+    def _extract_member_text(self, member: UFDRMember) -> TextExtractionResult:
+        with self._extractor.open_member(member.name) as stream:
+            return self._text_extractor.extract(stream, source_name=member.name)
+
+    def _collect_text_payload(
+        self,
+        member: UFDRMember,
+        pending: Future[TextExtractionResult] | None = None,
+    ) -> tuple[EvidencePayload, str] | None:
+        """Build the text payload for *member*, using *pending* when extraction was submitted to a pool."""
+
+        if member.size == 0:
+            if self._debug_enabled:
+                logger.debug("Arquivo %s está vazio; extração ignorada", member.name)
+            return None
+
         try:
-            logger.debug("Extraindo texto de %s", member.name)
-            with self._extractor.open_member(member.name) as stream:
-                result = self._text_extractor.extract(stream, source_name=member.name)
-            logger.debug("Extração concluída para %s (engine: %s, tamanho: %d)", member.name, result.engine, len(result.text))
+            if self._debug_enabled:
+                logger.debug("Extraindo texto de %s", member.name)
+            result = pending.result() if pending is not None else self._extract_member_text(member)
+            if self._debug_enabled:
+                logger.debug("Extração concluída para %s (engine: %s, tamanho: %d)", member.name, result.engine, len(result.text))
         except MissingDependencyError as exc:
             logger.warning("Dependência ausente ao processar %s: %s", member.name, exc)
             return None
@@ -218,8 +449,10 @@ class UFDRContentNavigator:
             logger.error("Falha ao extrair texto de %s: %s", member.name, exc, exc_info=True)
             return None
 
-        if not result.text.strip():
-            logger.debug("Arquivo %s não produziu texto relevante", member.name)
+        # isspace() stops at the first non-whitespace character instead of copying the text.
+        if not result.text or result.text.isspace():
+            if self._debug_enabled:
+                logger.debug("Arquivo %s não produziu texto relevante", member.name)
             return None
 
         payload = EvidencePayload(
@@ -235,32 +468,17 @@ class UFDRContentNavigator:
 
     @staticmethod
     def _is_database(member: UFDRMember) -> bool:
-        suffix = Path(member.name).suffix.lower()
-        return not member.is_dir and suffix in {".db", ".sqlite", ".sqlite3", ".s3db"}
+        return not member.is_dir and _SUFFIX_TO_TYPE.get(member.suffix) == "database"
 
     def _is_textual(self, member: UFDRMember) -> bool:
-        suffix = Path(member.name).suffix.lower()
+        suffix = member.suffix
         # If allowed_extensions is set, only check those
         if self._allowed_extensions is not None:
             return suffix in self._allowed_extensions
         # Otherwise, use default behavior (all textual + image extensions)
-        return suffix in TEXTUAL_EXTENSIONS or suffix in IMAGE_EXTENSIONS
+        file_type = _SUFFIX_TO_TYPE.get(suffix)
+        return file_type is not None and file_type != "database"
 
     @staticmethod
     def _guess_file_type(member: UFDRMember) -> str:
-        suffix = Path(member.name).suffix.lower()
-        if suffix in IMAGE_EXTENSIONS:
-            return "image"
-        if suffix in TEXTUAL_EXTENSIONS:
-            if suffix in {".pdf", ".doc", ".docx", ".ppt", ".pptx"}:
-                return "document"
-            if suffix in {".xls", ".xlsx", ".ods"}:
-                return "spreadsheet"
-            if suffix in {".eml", ".msg"}:
-                return "email"
-            if suffix in {".ics"}:
-                return "calendar"
-            if suffix in {".vcf"}:
-                return "contact"
-            return "text"
-        return "binary"
+        return _SUFFIX_TO_TYPE.get(member.suffix, "binary")
@@ -3,22 +3,33 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterator, Mapping
+from typing import Iterator, List, Mapping, Tuple
 from tempfile import NamedTemporaryFile
 
 from src.extractor import UFDRExtractor, UFDRMember
 
 logger = logging.getLogger(__name__)
 
-SQLITE_EXTENSIONS = {".db", ".sqlite", ".sqlite3", ".s3db"}
+SQLITE_EXTENSIONS = frozenset({".db", ".sqlite", ".sqlite3", ".s3db"})
 
+# Databases up to this size are loaded straight into memory via
+# ``sqlite3.Connection.deserialize``; larger ones go through a temp file.
+DESERIALIZE_MAX_BYTES = 256 * 1024 * 1024
+# Memory-map size requested for databases opened from a temp file.
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+# Buffer used when copying large databases out of the archive.
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+# Rows pulled from SQLite per ``fetchmany`` call.
+FETCH_BATCH_SIZE = 10_000
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DatabaseRow:
     """Single row extracted from a SQLite database inside a UFDR package."""
 
@@ -41,41 +52,109 @@ class UFDRDatabaseReader:
         for member in self._extractor.iter_members():
             if member.is_dir:
                 continue
-            suffix = Path(member.name).suffix.lower()
-            if suffix in SQLITE_EXTENSIONS:
+            if member.suffix in SQLITE_EXTENSIONS:
                 logger.debug("Identified SQLite database %s inside %s", member.name, self._extractor.ufdr_path)
                 yield member
 
     def iter_rows(self, member: UFDRMember) -> Iterator[DatabaseRow]:
         """Iterate through every row contained in a SQLite database member."""
 
+        normalize = self._normalize_value
+        source_file = self._extractor.ufdr_path
+        for table_name, columns, first_row_index, batch in self._iter_table_batches(member, FETCH_BATCH_SIZE):
+            for row_index, row in enumerate(batch, first_row_index):
+                # TEXT cells (the common case) skip the normalizer call entirely.
+                values = {
+                    column: value if type(value) is str else normalize(value)
+                    for column, value in zip(columns, row)
+                }
+                yield DatabaseRow(
+                    source_file=source_file,
+                    internal_path=member.name,
+                    table=table_name,
+                    row_index=row_index,
+                    values=values,
+                )
+
+    def _iter_table_batches(
+        self, member: UFDRMember, batch_size: int
+    ) -> Iterator[Tuple[str, Tuple[str, ...], int, List[Tuple[object, ...]]]]:
+        """Yield ``(table, columns, first_row_index, raw_rows)`` for every fetched batch."""
+
+        with self._open_database(member) as connection:
+            for table_name in self._list_tables(connection):
+                query = f"""SELECT * FROM {self._quote_identifier(table_name)}"""
+                cursor = connection.execute(query)
+                # Column names come with the cursor; no separate PRAGMA table_info round-trip.
+                columns = tuple(description[0] for description in cursor.description)
+                row_index = 0
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield table_name, columns, row_index, batch
+                    row_index += len(batch)
+
+    @contextmanager
+    def _open_database(self, member: UFDRMember) -> Iterator[sqlite3.Connection]:
+        """Open *member* as a SQLite connection, in memory when it is small enough."""
+
+        if member.size <= DESERIALIZE_MAX_BYTES and hasattr(sqlite3.Connection, "deserialize"):
+            blob = self._read_member(member)
+            logger.debug("Loaded database %s in memory (%d bytes)", member.name, len(blob))
+            with self._open_memory_connection(blob) as connection:
+                yield connection
+            return
+
         with self._materialize_member(member) as sqlite_path:
             logger.debug("Materialized database %s to %s", member.name, sqlite_path)
             with self._open_connection(sqlite_path) as connection:
-                tables = self._list_tables(connection)
-                for table_name in tables:
-                    columns = self._list_columns(connection, table_name)
-                    query = f"""SELECT * FROM {self._quote_identifier(table_name)}"""
-                    cursor = connection.execute(query)
-                    for row_index, row in enumerate(cursor):
-                        casted = self._normalize_row(dict(zip(columns, row)))
-                        yield DatabaseRow(
-                            source_file=self._extractor.ufdr_path,
-                            internal_path=member.name,
-                            table=table_name,
-                            row_index=row_index,
-                            values=casted,
-                        )
+                yield connection
+
+    def _read_member(self, member: UFDRMember) -> bytearray:
+        """Read *member* into a mutable buffer sized from the archive listing."""
+
+        blob = bytearray(member.size)
+        filled = 0
+        with self._extractor.open_member(member.name) as member_stream, memoryview(blob) as view:
+            while filled < len(blob):
+                count = member_stream.readinto(view[filled : filled + COPY_BUFFER_SIZE])
+                if not count:
+                    break
+                filled += count
+        del blob[filled:]
+        return blob
+
+    @contextmanager
+    def _open_memory_connection(self, blob: bytearray) -> Iterator[sqlite3.Connection]:
+        # SQLite cannot read a deserialized WAL-mode image; mark it as rollback-journal
+        # (header bytes 18-19) since the -wal file is not part of the image anyway.
+        if blob[18:20] == b"\x02\x02":
+            blob[18:20] = b"\x01\x01"
+
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.deserialize(blob)
+            connection.row_factory = sqlite3.Row
+            yield connection
+        finally:
+            connection.close()
 
     @contextmanager
     def _materialize_member(self, member: UFDRMember) -> Iterator[Path]:
         """Copy a UFDR member to a temporary file and yield its path."""
 
-        suffix = Path(member.name).suffix or ".db"
+        suffix = member.suffix or ".db"
         with NamedTemporaryFile(delete=False, suffix=suffix) as handle:
             temp_path = Path(handle.name)
+            if hasattr(os, "posix_fallocate") and member.size > 0:
+                try:
+                    # Reserve the full size up front instead of growing the file per write.
+                    os.posix_fallocate(handle.fileno(), 0, member.size)
+                except OSError:
+                    logger.debug("posix_fallocate unsupported for %s", temp_path)
             with self._extractor.open_member(member.name) as member_stream:
-                shutil.copyfileobj(member_stream, handle)
+                shutil.copyfileobj(member_stream, handle, COPY_BUFFER_SIZE)
 
         try:
             yield temp_path
@@ -89,43 +168,32 @@ class UFDRDatabaseReader:
     def _open_connection(self, sqlite_path: Path) -> Iterator[sqlite3.Connection]:
         connection = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True)
         connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
         try:
             yield connection
         finally:
             connection.close()
 
-    def _list_tables(self, connection: sqlite3.Connection) -> Iterator[str]:
+    def _list_tables(self, connection: sqlite3.Connection) -> List[str]:
         cursor = connection.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
         )
-        for row in cursor.fetchall():
-            table = row["name"]
-            if isinstance(table, str):
-                yield table
-
-    def _list_columns(self, connection: sqlite3.Connection, table_name: str) -> Iterator[str]:
-        pragma = f"PRAGMA table_info({self._quote_identifier(table_name)})"
-        cursor = connection.execute(pragma)
-        for row in cursor.fetchall():
-            column = row["name"]
-            if isinstance(column, str):
-                yield column
-
-    def _normalize_row(self, raw_row: Dict[str, object]) -> Dict[str, str]:
-        normalized: Dict[str, str] = {}
-        for key, value in raw_row.items():
-            normalized[key] = self._normalize_value(value)
-        return normalized
+        return [row["name"] for row in cursor.fetchall() if isinstance(row["name"], str)]
 
     @staticmethod
     def _normalize_value(value: object) -> str:
+        # Exact type checks first: SQLite only returns str, int, float, bytes or None.
+        value_type = type(value)
+        if value_type is str:
+            return value  # type: ignore[return-value]
         if value is None:
             return ""
-        if isinstance(value, bytes):
+        if value_type is bytes:
             try:
-                return value.decode("utf-8")
+                return value.decode("utf-8")  # type: ignore[union-attr]
             except UnicodeDecodeError:
-                return value.decode("latin-1", errors="ignore")
+                # Latin-1 maps every byte, so legacy-encoded text is kept instead of replaced.
+                return value.decode("latin-1")  # type: ignore[union-attr]
         return str(value)
 
     @staticmethod
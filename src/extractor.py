@@ -6,17 +6,41 @@ Handles UFDR packages as ZipFile archives to enumerate and extract their content
 from __future__ import annotations
 
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
+import mmap
+import os
+import struct
+import threading
 from pathlib import Path
-from typing import IO, Iterable, Iterator, List, Sequence
+from typing import IO, Callable, Iterable, Iterator, List, Sequence
 from zipfile import BadZipFile, ZipFile
 
 logger = logging.getLogger(__name__)
 
+# Zip end-of-central-directory record and central directory file header layouts.
+_EOCD = struct.Struct("<4s4H2LH")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_ZIP64_MARKER = 0xFFFFFFFF
+_ZIP64_ENTRIES_MARKER = 0xFFFF
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_LOCATOR_SIZE = 20
 
-@dataclass(frozen=True)
+
+def member_suffix(name: str) -> str:
+    """Return the lowercase suffix of an archive member name (like ``Path.suffix``)."""
+
+    base_start = name.rfind("/") + 1
+    dot = name.rfind(".")
+    if dot <= base_start or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
+
+@dataclass(frozen=True, slots=True)
 class UFDRMember:
     """Metadata for a single member inside an UFDR archive."""
 
@@ -25,14 +49,28 @@ class UFDRMember:
     compressed_size: int
     is_dir: bool
     modified: datetime | None
+    # Lowercase suffix of ``name``; computed once so classifiers can reuse it.
+    suffix: str = field(default="", compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.suffix:
+            object.__setattr__(self, "suffix", member_suffix(self.name))
 
 
 class UFDRExtractor:
-    """Open and interact with UFDR (zip) evidence files."""
+    """Open and interact with UFDR (zip) evidence files.
+
+    A single ``ZipFile`` handle is opened lazily and shared by every operation,
+    so the central directory is parsed only once. Call :meth:`close` (or use the
+    extractor as a context manager) to release it.
+    """
 
     def __init__(self, ufdr_path: Path | str, *, encoding: str = "utf-8") -> None:
         self.ufdr_path = Path(ufdr_path).expanduser()
         self.encoding = encoding
+        # Archive handle shared by all operations; see _get_archive/close.
+        self._archive: ZipFile | None = None
+        self._archive_lock = threading.Lock()
 
     def validate_source(self) -> None:
         """Ensure the UFDR source file exists and can be read."""
@@ -46,28 +84,57 @@ class UFDRExtractor:
     def iter_members(self) -> Iterator[UFDRMember]:
         """Yield metadata for every member contained in the UFDR archive."""
 
-        self.validate_source()
+        return self.iter_members_filtered(None)
+
+    def iter_members_filtered(self, predicate: Callable[[str], bool] | None) -> Iterator[UFDRMember]:
+        """Yield metadata for members whose name satisfies *predicate*.
+
+        The predicate runs on the raw entry name, before the member's
+        timestamp is parsed or its :class:`UFDRMember` is built.
+        """
 
         try:
-            with ZipFile(self.ufdr_path) as archive:
-                for info in archive.infolist():
-                    modified = None
-                    try:
-                        modified = datetime(*info.date_time)
-                    except (TypeError, ValueError):
-                        logger.debug("Member %s missing valid timestamp", info.filename)
-
-                    yield UFDRMember(
-                        name=info.filename,
-                        size=info.file_size,
-                        compressed_size=info.compress_size,
-                        is_dir=info.is_dir(),
-                        modified=modified,
-                    )
-        except BadZipFile as exc:
+            infos = self._get_archive().infolist()
+        except BadZipFile:
             logger.error("File %s is not a valid UFDR/zip archive", self.ufdr_path)
             raise
 
+        for info in infos:
+            name = info.filename
+            if predicate is not None and not predicate(name):
+                continue
+
+            modified = None
+            try:
+                modified = datetime(*info.date_time)
+            except (TypeError, ValueError):
+                logger.debug("Member %s missing valid timestamp", name)
+
+            yield UFDRMember(
+                name=name,
+                size=info.file_size,
+                compressed_size=info.compress_size,
+                is_dir=info.is_dir(),
+                modified=modified,
+                suffix=member_suffix(name),
+            )
+
+    def iter_members_fast(self, predicate: Callable[[str], bool] | None = None) -> Iterator[UFDRMember]:
+        """Enumerate members by scanning the central directory through ``mmap``.
+
+        Intended for listing-only callers: no ``ZipInfo`` objects are built and
+        the archive is not kept open. Zip64 or otherwise unusual archives fall
+        back to :meth:`iter_members_filtered`.
+        """
+
+        self.validate_source()
+        try:
+            members = self._scan_central_directory(predicate)
+        except (ValueError, struct.error, OSError) as exc:
+            logger.debug("Fast central directory scan failed for %s (%s); using ZipFile", self.ufdr_path, exc)
+            return self.iter_members_filtered(predicate)
+        return iter(members)
+
     def list_members(self) -> List[UFDRMember]:
         """Return all members as a list."""
 
@@ -84,10 +151,10 @@ class UFDRExtractor:
 
         extracted: List[Path] = []
         try:
-            with ZipFile(self.ufdr_path) as archive:
-                for member in archive.infolist():
-                    archive.extract(member, path=destination_path)
-                    extracted.append(destination_path / member.filename)
+            archive = self._get_archive()
+            for member in archive.infolist():
+                archive.extract(member, path=destination_path)
+                extracted.append(destination_path / member.filename)
         except BadZipFile:
             logger.error("Failed to extract invalid UFDR archive %s", self.ufdr_path)
             raise
@@ -106,10 +173,10 @@ class UFDRExtractor:
 
         extracted: List[Path] = []
         try:
-            with ZipFile(self.ufdr_path) as archive:
-                for name in members:
-                    archive.extract(name, path=destination_path)
-                    extracted.append(destination_path / name)
+            archive = self._get_archive()
+            for name in members:
+                archive.extract(name, path=destination_path)
+                extracted.append(destination_path / name)
         except BadZipFile:
             logger.error("Failed to extract members from invalid UFDR archive %s", self.ufdr_path)
             raise
@@ -118,21 +185,112 @@ class UFDRExtractor:
 
     @contextmanager
     def open_member(self, member_name: str) -> Iterator[IO[bytes]]:
-        """Open a member inside the UFDR archive as a binary stream."""
+        """Open a member inside the UFDR archive as a binary stream.
 
-        self.validate_source()
+        ZipFile serializes reads of concurrently open members internally.
+        """
 
         try:
-            with ZipFile(self.ufdr_path) as archive:
-                with archive.open(member_name) as handle:
-                    yield handle
+            with self._get_archive().open(member_name) as handle:
+                yield handle
         except BadZipFile:
             logger.error("Failed to open member %s from invalid UFDR archive %s", member_name, self.ufdr_path)
             raise
 
+    def close(self) -> None:
+        """Close the cached archive handle; it is reopened on next use."""
+
+        with self._archive_lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+
+    def __enter__(self) -> UFDRExtractor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _scan_central_directory(self, predicate: Callable[[str], bool] | None) -> List[UFDRMember]:
+        members: List[UFDRMember] = []
+        with open(self.ufdr_path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            size = len(view)
+            eocd = view.rfind(_EOCD_SIGNATURE, max(0, size - 0xFFFF - _EOCD.size))
+            if eocd < 0:
+                raise ValueError("end of central directory not found")
+            _, _, _, _, entries, directory_size, _, comment_length = _EOCD.unpack_from(view, eocd)
+            if eocd + _EOCD.size + comment_length != size or directory_size == _ZIP64_MARKER:
+                raise ValueError("unsupported end of central directory")
+            # ZIP64 archives keep the real counts in a record placed before the EOCD;
+            # the 16-bit entry count here saturates at 0xFFFF.
+            locator = eocd - _ZIP64_LOCATOR_SIZE
+            if entries == _ZIP64_ENTRIES_MARKER or (
+                locator >= 0 and view[locator:locator + 4] == _ZIP64_LOCATOR_SIGNATURE
+            ):
+                raise ValueError("zip64 end of central directory")
+
+            # Measured back from the EOCD, so data prepended to the archive is tolerated.
+            position = eocd - directory_size
+            unpack = _CENTRAL_HEADER.unpack_from
+            header_size = _CENTRAL_HEADER.size
+            for _ in range(entries):
+                (signature, _, _, flags, _, dos_time, dos_date, _, compressed_size, file_size,
+                 name_length, extra_length, comment_length, _, _, _, _) = unpack(view, position)
+                if signature != _CENTRAL_SIGNATURE:
+                    raise ValueError("corrupt central directory")
+                if file_size == _ZIP64_MARKER or compressed_size == _ZIP64_MARKER:
+                    raise ValueError("zip64 entry")
+
+                name_start = position + header_size
+                position = name_start + name_length + extra_length + comment_length
+                name = view[name_start:name_start + name_length].decode("utf-8" if flags & 0x800 else "cp437")
+                # Same cleanup as ZipInfo: cut at the first NUL byte, use "/" separators.
+                null_byte = name.find("\0")
+                if null_byte >= 0:
+                    name = name[:null_byte]
+                if os.sep != "/" and os.sep in name:
+                    name = name.replace(os.sep, "/")
+                if predicate is not None and not predicate(name):
+                    continue
+
+                try:
+                    modified = datetime(
+                        (dos_date >> 9) + 1980,
+                        (dos_date >> 5) & 0xF,
+                        dos_date & 0x1F,
+                        dos_time >> 11,
+                        (dos_time >> 5) & 0x3F,
+                        (dos_time & 0x1F) * 2,
+                    )
+                except ValueError:
+                    logger.debug("Member %s missing valid timestamp", name)
+                    modified = None
+
+                members.append(
+                    UFDRMember(
+                        name=name,
+                        size=file_size,
+                        compressed_size=compressed_size,
+                        is_dir=name.endswith("/"),
+                        modified=modified,
+                        suffix=member_suffix(name),
+                    )
+                )
+            if position != eocd:
+                raise ValueError("central directory size mismatch")
+        return members
+
+    def _get_archive(self) -> ZipFile:
+        with self._archive_lock:
+            if self._archive is None:
+                self.validate_source()
+                self._archive = ZipFile(self.ufdr_path)
+            return self._archive
+
 
 def list_ufdr_members(ufdr_path: Path | str) -> List[UFDRMember]:
     """Convenience function that returns metadata for every UFDR member."""
 
-    extractor = UFDRExtractor(ufdr_path)
-    return extractor.list_members()
+    members = list(UFDRExtractor(ufdr_path).iter_members_fast())
+    logger.debug("Indexed %d entries in %s", len(members), ufdr_path)
+    return members
@@ -0,0 +1,103 @@
+"""Lightweight argparse entry point for scripted scans (F7).
+
+Runs the same pipeline as ``src.cli scan`` without importing Typer/Click,
+which dominate the start-up time of the full CLI. It prints only the final
+summary; use ``src.cli`` for progress bars and verbose output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from src.logger import configure_logging
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="prometheus-scan",
+        description="Executa a varredura forense completa (sem barra de progresso).",
+    )
+    parser.add_argument("-i", "--input", required=True, type=Path, help="Diretório com arquivos .ufdr.")
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        default=Path("config/patterns.json"),
+        help="Arquivo JSON com os padrões de regex.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("outputs/prometheus_results.json"),
+        help="Arquivo de saída JSON consolidado.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Processos paralelos (um arquivo .ufdr por processo); 0 usa todos os núcleos.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostra logs detalhados durante a execução.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Parse *argv*, run the pipeline and return the process exit code."""
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    input_dir: Path = args.input.expanduser().resolve()
+    if not input_dir.is_dir():
+        parser.error(f"Diretório de entrada inválido: {input_dir}")
+    if args.workers < 0:
+        parser.error("O número de processos não pode ser negativo.")
+    if not args.config.exists():
+        parser.error(f"Arquivo de configuração não encontrado: {args.config}")
+
+    configure_logging(verbose=args.verbose, rotate=False)
+
+    from src.main import run_pipeline
+    from src.scanner import UFDRScanner
+
+    ufdr_paths = UFDRScanner.list_paths(UFDRScanner(input_dir).scan())
+    if not ufdr_paths:
+        print(f"Nenhum arquivo .ufdr encontrado em: {input_dir}", file=sys.stderr)
+        return 1
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    summary = run_pipeline(
+        input_dir=input_dir,
+        config_path=args.config,
+        output_path=args.output,
+        ufdr_paths=ufdr_paths,
+        max_workers=args.workers or None,
+    )
+
+    lines = [
+        f"Arquivos processados: {summary.get('processed', 0)}",
+        f"Ocorrências encontradas: {summary.get('matches', 0)}",
+    ]
+    failures = summary.get("failures", [])
+    if failures:
+        lines.append(f"Arquivos com falhas: {len(failures)}")
+        lines.extend(f"  - {Path(failure).name}" for failure in failures)
+    lines.append(f"JSON: {summary['output']}")
+    lines.append(f"CSV: {summary['csv_output']}")
+    sys.stderr.write("\n".join(lines) + "\n")
+    return 0
+
+
+def run() -> None:
+    """Helper to execute the lightweight CLI from other entry points."""
+
+    sys.exit(main())
+
+
+if __name__ == "__main__":
+    run()
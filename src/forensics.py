@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from src.content_navigator import EvidencePayload
 from src.models import EvidenceMatch
@@ -14,50 +14,70 @@ from src.regex_engine import RegexMatch
 def build_evidence_match(payload: EvidencePayload, regex_match: RegexMatch) -> EvidenceMatch:
     """Combine navigator payload and regex match into an EvidenceMatch."""
 
+    return build_evidence_matches(payload, (regex_match,))[0]
+
+
+def build_evidence_matches(payload: EvidencePayload, regex_matches: Iterable[RegexMatch]) -> List[EvidenceMatch]:
+    """Build one EvidenceMatch per regex match found in the same payload.
+
+    Payload-level fields (file name, timestamp, table/row context) are computed
+    once and shared by every match.
+    """
+
     source_file = Path(payload.source_file).name
     internal_path = payload.internal_path
     file_type = payload.file_type
-    pattern_type = regex_match.pattern.name
-    match_value = regex_match.value
-    context = _compose_context(payload, regex_match)
     timestamp = _format_timestamp(payload.modified)
+    prefix = _payload_context_prefix(payload)
 
-    return EvidenceMatch(
-        source_file=source_file,
-        internal_path=internal_path,
-        file_type=file_type,
-        pattern_type=pattern_type,
-        match_value=match_value,
-        context=context,
-        timestamp=timestamp,
-    )
+    return [
+        EvidenceMatch(
+            source_file=source_file,
+            internal_path=internal_path,
+            file_type=file_type,
+            pattern_type=regex_match.pattern.name,
+            match_value=regex_match.value,
+            context=_compose_context(prefix, regex_match),
+            timestamp=timestamp,
+        )
+        for regex_match in regex_matches
+    ]
 
 
-def _compose_context(payload: EvidencePayload, regex_match: RegexMatch) -> Optional[str]:
-    pieces: list[str] = []
+def _payload_context_prefix(payload: EvidencePayload) -> Optional[str]:
+    if payload.payload_type != "database_row":
+        return None
+
+    table = payload.metadata.get("table")
+    row_index = payload.metadata.get("row_index")
+    if table and row_index is not None:
+        return f"tabela {table} | linha {row_index}"
+    if table:
+        return f"tabela {table}"
+    if row_index is not None:
+        return f"linha {row_index}"
+    return None
 
-    if payload.payload_type == "database_row":
-        table = payload.metadata.get("table")
-        row_index = payload.metadata.get("row_index")
-        if table:
-            pieces.append(f"tabela {table}")
-        if row_index is not None:
-            pieces.append(f"linha {row_index}")
 
-    if regex_match.location:
-        pieces.append(regex_match.location)
+def _compose_context(prefix: Optional[str], regex_match: RegexMatch) -> Optional[str]:
+    # Joined pairwise: at most three pieces, so no list is built per match.
+    context = prefix
+    location = regex_match.location
+    if location:
+        context = f"{context} | {location}" if context is not None else location
 
     if regex_match.context:
-        pieces.append(regex_match.context.strip())
+        snippet = regex_match.context.strip()
+        context = f"{context} | {snippet}" if context is not None else snippet
 
-    if not pieces:
-        return None
-    return " | ".join(pieces)
+    return context
 
 
 def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
     if value is None:
         return None
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
-    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Naive values are already UTC; formatting them without an offset lets the
+    # "Z" be appended directly instead of patching "+00:00" afterwards.
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat() + "Z"
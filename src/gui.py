@@ -3,20 +3,35 @@
 from __future__ import annotations
 
 import json
+import logging
+import shutil
 import signal
 import sys
-from dataclasses import dataclass
+from functools import cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
 
 # Configure Qt plugins BEFORE importing any PyQt6 modules
 from src.qt_utils import configure_qt_plugins
 configure_qt_plugins()
 
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QDesktopServices, QFont, QPalette, QColor, QIcon, QAction
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QDesktopServices, QFileSystemModel, QFont, QPalette, QColor, QIcon, QAction
 from PyQt6.QtWidgets import (
     QApplication,
+    QCompleter,
     QFileDialog,
     QFormLayout,
     QFrame,
@@ -28,9 +43,11 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QProgressBar,
+    QAbstractItemView,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
     QTabWidget,
     QTextBrowser,
     QVBoxLayout,
@@ -38,18 +55,126 @@ from PyQt6.QtWidgets import (
     QHeaderView,
 )
 
-from src.logger import configure_logging
-from src.main import run_pipeline
+from src.logger import configure_logging, get_logger
 
 DEFAULT_PATTERNS_PATH = Path("config/regex_patterns.json")
+# Resolved once against the launch directory; the GUI never changes cwd.
+_DEFAULT_PATTERNS_PATH_RESOLVED = DEFAULT_PATTERNS_PATH.resolve()
 APP_ICON_PATH = Path("icon.png")
 DEFAULT_OUTPUT_PATH = Path("outputs/prometheus_results.json")
 DEFAULT_LOG_PATH = Path("outputs/logs/gui.log")
+# Rows handed to the view per insert while a scan streams its results.
+RESULT_BATCH_SIZE = 500
+# Rows serialised per write when exporting the grid.
+EXPORT_CHUNK_SIZE = 5_000
+# Initial widths of Arquivo, Tipo, Valor, Caminho Interno and Timestamp.
+RESULT_COLUMN_WIDTHS = (220, 120, 260, 300, 160)
+IDLE_STATUS = "Pronto para iniciar."
+# How long transient banner messages stay before the idle text returns.
+STATUS_RESET_MS = 5000
+# Minimum interval between progress bar repaints during text extraction.
+PROGRESS_FLUSH_MS = 80
+_STATUS_COLORS = {"info": "#9aa3ba", "success": "#3fbdb0", "error": "#ff8a80"}
+
+
+_STYLESHEET = (
+    "QLineEdit, QTextBrowser { border: 1px solid #4f566b; border-radius: 6px; padding: 6px; }"
+    "QPushButton { background-color: #4c82ff; border-radius: 6px; padding: 8px 14px; color: #ecf0f4; }"
+    "QPushButton:hover { background-color: #386ef5; }"
+    "QGroupBox { border: 1px solid #4f566b; border-radius: 8px; margin-top: 12px; }"
+    "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 6px; }"
+    "QTableView { gridline-color: #3d4354; selection-background-color: #6eaef0; selection-color: #10141d; }"
+)
+
+
+_HELP_TEMPLATE = """
+<h2 style='color:#eff3ff;'>Guia Rápido</h2>
+<p>A Prometheus Forensic Tool automatiza a análise de pacotes <code>.ufdr</code>:
+encontra arquivos, extrai dados internos e aplica padrões de regex configuráveis
+para gerar um relatório consolidado.</p>
+
+<h3 style='color:#eff3ff;'>Fluxo de Trabalho</h3>
+<ol>
+    <li>Escolha o diretório de evidências com os arquivos <code>.ufdr</code>.</li>
+    <li>Selecione o arquivo de padrões (por padrão: <code>{patterns_path}</code>).</li>
+    <li>Inicie a varredura. O pipeline definitivo consolidará todos os resultados em um único JSON.</li>
+</ol>
+
+<h3 style='color:#eff3ff;'>Padrões Regex</h3>
+<p>Os padrões ficam em <code>config/patterns.json</code>. Cada entrada contém:</p>
+<ul>
+    <li><b>name</b>: identificador do padrão (ex.: <code>CPF</code>).</li>
+    <li><b>regex</b>: expressão regular usada na busca.</li>
+    <li><b>flags</b> (opcional): lista com <code>ignorecase</code>, <code>multiline</code>, <code>dotall</code> ou <code>unicode</code>.</li>
+</ul>
+<p>Use o botão "Abrir patterns.json" para revisar ou editar o arquivo padrão.</p>
+
+<h3 style='color:#eff3ff;'>Módulos Implementados</h3>
+<ul>
+    <li><code>scanner.py</code>: busca recursiva por <code>.ufdr</code> (F1).</li>
+    <li><code>extractor.py</code>: trata <code>.ufdr</code> como arquivos <i>zip</i> (F2).</li>
+    <li><code>regex_engine.py</code>: executa os padrões configurados (F4).</li>
+    <li><code>cli.py</code>: interface de linha de comando (F7).</li>
+    <li><code>gui.py</code>: esta interface moderna em PyQt6 (F8).</li>
+</ul>
+
+<h3 style='color:#eff3ff;'>Status do Projeto</h3>
+<p>O pipeline completo ainda será integrado em <code>run_pipeline</code>. Até lá, use os módulos individuais
+para validar resultados ou experimentar com dados de teste.</p>
+
+<p style='margin-top:16px;color:#a7b2d6;'>Desenvolvido por Matheus C. Pestana (GENI/UFF).</p>
+"""
+
+
+@cache
+def _gui_logger() -> logging.Logger:
+    """Attach the GUI log handlers once; windows and signal handlers reuse them."""
+
+    return configure_logging(verbose=False, log_path=DEFAULT_LOG_PATH)
+
+
+@cache
+def _help_html() -> str:
+    """Format the help page once per process; every window shares the result."""
+
+    return _HELP_TEMPLATE.format(patterns_path=_DEFAULT_PATTERNS_PATH_RESOLVED)
+
+
+@cache
+def _dark_palette() -> QPalette:
+    """Build the neo-dark palette once; QPalette needs a QApplication, so not at import."""
+
+    palette = QPalette()
+    background = QColor(30, 34, 45)
+    surface = QColor(40, 44, 55)
+    text = QColor(236, 239, 244)
+
+    palette.setColor(QPalette.ColorRole.Window, background)
+    palette.setColor(QPalette.ColorRole.Base, surface)
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(46, 50, 63))
+    palette.setColor(QPalette.ColorRole.Text, text)
+    palette.setColor(QPalette.ColorRole.WindowText, text)
+    palette.setColor(QPalette.ColorRole.Button, surface)
+    palette.setColor(QPalette.ColorRole.ButtonText, text)
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(110, 174, 236))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(16, 20, 29))
+    return palette
+
 
+@cache
+def _get_app_icon() -> Optional[QIcon]:
+    """Load the application icon once (None when icon.png is missing)."""
 
-@dataclass
-class ResultRow:
-    """Representation of a result entry shown in the results grid."""
+    if not APP_ICON_PATH.exists():
+        return None
+    return QIcon(str(APP_ICON_PATH.resolve()))
+
+
+class ResultRow(NamedTuple):
+    """Representation of a result entry shown in the results grid.
+
+    A NamedTuple so batches can be transposed into model columns with zip().
+    """
 
     source_file: str
     pattern_type: str
@@ -58,6 +183,298 @@ class ResultRow:
     timestamp: str
 
 
+class ScanInputs(NamedTuple):
+    """Validated paths for one scan."""
+
+    evidence_dir: Path
+    config_file: Path
+
+
+class ScanInputError(ValueError):
+    """Invalid scan input; ``title`` is the caption of the warning shown to the user."""
+
+    def __init__(self, title: str, message: str) -> None:
+        super().__init__(message)
+        self.title = title
+
+
+class ResultsModel(QAbstractTableModel):
+    """Table model exposing results to a QTableView without per-cell items.
+
+    Cells are stored column-wise (one list of strings per column), so reads
+    are plain list indexing and no ResultRow objects are kept alive. Once a
+    scan is over, finalize() turns the columns into tuples; the next append
+    turns them back into lists.
+    """
+
+    HEADERS = ("Arquivo", "Tipo", "Valor", "Caminho Interno", "Timestamp")
+    ATTRIBUTES = ("source_file", "pattern_type", "match_value", "internal_path", "timestamp")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._columns: List[Sequence[str]] = [[] for _ in self.ATTRIBUTES]
+        self._frozen = False
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        # Only visible cells are queried, so nothing is built for off-screen rows.
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._columns[index.column()][index.row()]
+
+    def set_rows(self, rows: Sequence[ResultRow]) -> None:
+        """Replace every row with a single model reset."""
+
+        self.set_columns(self._split_columns(rows))
+
+    def set_columns(self, columns: Sequence[Sequence[str]]) -> None:
+        """Replace the data with pre-built columns (one sequence per header)."""
+
+        if len(columns) != len(self.ATTRIBUTES) or len({len(column) for column in columns}) > 1:
+            raise ValueError("ResultsModel expects one equally sized column per header")
+        self.beginResetModel()
+        self._columns = [list(column) for column in columns]
+        self._frozen = False
+        self.endResetModel()
+
+    def extend(self, rows: List[ResultRow]) -> None:
+        """Append rows with one insert notification for the whole batch."""
+
+        if not rows:
+            return
+        if self._frozen:
+            self._columns = [list(column) for column in self._columns]
+            self._frozen = False
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for column, values in zip(self._columns, self._split_columns(rows)):
+            column.extend(values)
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Reorder every column by *column* (plain string order, stable)."""
+
+        if not 0 <= column < len(self._columns):
+            return
+        keys = self._columns[column]
+        # ISO-8601 timestamps sort chronologically as plain strings.
+        permutation = sorted(
+            range(len(keys)), key=keys.__getitem__, reverse=order == Qt.SortOrder.DescendingOrder
+        )
+
+        self.layoutAboutToBeChanged.emit()
+        container = tuple if self._frozen else list
+        self._columns = [container([values[index] for index in permutation]) for values in self._columns]
+        persistent = self.persistentIndexList()
+        if persistent:
+            new_rows = [0] * len(permutation)
+            for new_row, old_row in enumerate(permutation):
+                new_rows[old_row] = new_row
+            self.changePersistentIndexList(
+                persistent, [self.index(new_rows[index.row()], index.column()) for index in persistent]
+            )
+        self.layoutChanged.emit()
+
+    def finalize(self) -> None:
+        """Store the columns as tuples: no over-allocation slack, immutable reads."""
+
+        if not self._frozen:
+            self._columns = [tuple(column) for column in self._columns]
+            self._frozen = True
+
+    def columns(self) -> List[Sequence[str]]:
+        """Return the current column lists for read-only use off the GUI thread.
+
+        Later batches only append to these lists and sort/reset replace them,
+        so a reader bounded by the current rowCount() sees a stable snapshot.
+        """
+
+        return list(self._columns)
+
+    def row(self, row: int) -> ResultRow:
+        """Rebuild the ResultRow at *row* (for export and tests)."""
+
+        return ResultRow(*(column[row] for column in self._columns))
+
+    def _split_columns(self, rows: Sequence[ResultRow]) -> List[List[str]]:
+        if not rows:
+            return [[] for _ in self.ATTRIBUTES]
+        return [list(column) for column in zip(*rows)]
+
+
+class ResultsProxyModel(QSortFilterProxyModel):
+    """Filter proxy that hands sorting down to ResultsModel.
+
+    QSortFilterProxyModel sorts by calling lessThan() from C++ once per
+    comparison, which costs seconds on large result sets when lessThan is
+    Python. The source model sorts its columns with ``sorted`` instead and the
+    proxy keeps the source order.
+    """
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.sourceModel().sort(column, order)
+
+
+class ResultsDelegate(QStyledItemDelegate):
+    """Delegate that fetches only the display text of each cell.
+
+    The stock initStyleOption asks the model for about eight roles per painted
+    cell (font, alignment, colours, check state, icon...). The results model
+    only serves DisplayRole, so one data() call per cell is enough.
+    """
+
+    _ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        option.index = index
+        option.text = index.data() or ""
+        option.displayAlignment = self._ALIGNMENT
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by ScanWorker; QRunnable itself cannot carry signals."""
+
+    progress = pyqtSignal(dict)
+    batch_ready = pyqtSignal(list)
+    result = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class ScanWorker(QRunnable):
+    """Run the pipeline on a QThreadPool thread so the window keeps repainting.
+
+    Pipeline events are forwarded through ``signals.progress``. Matches are
+    streamed by the pipeline while it runs and handed over through
+    ``signals.batch_ready`` in chunks of RESULT_BATCH_SIZE; Qt queues both to
+    the GUI thread, which is the only place widgets are touched.
+    """
+
+    def __init__(self, evidence_dir: Path, config_path: Path, output_path: Path) -> None:
+        super().__init__()
+        self.evidence_dir = evidence_dir
+        self.config_path = config_path
+        self.output_path = output_path
+        self.signals = WorkerSignals()
+        self._pending_rows: List[ResultRow] = []
+
+    def run(self) -> None:
+        try:
+            # Imported on first scan: the pipeline stack (zip, SQLite, text
+            # extraction, regex) is not needed to paint the window.
+            from src.main import run_pipeline
+
+            summary = run_pipeline(
+                input_dir=self.evidence_dir,
+                config_path=self.config_path,
+                output_path=self.output_path,
+                progress_callback=self._handle_event,
+                stream_matches=True,
+            )
+            self._flush_rows()
+            self.signals.result.emit(summary)
+        except Exception as exc:  # pragma: no cover - reported to the GUI
+            get_logger().exception("Erro ao executar a varredura")
+            self.signals.error.emit(str(exc))
+        finally:
+            self.signals.finished.emit()
+
+    def _handle_event(self, event: dict) -> None:
+        if event.get("type") != "matches":
+            self.signals.progress.emit(event)
+            return
+        pending = self._pending_rows
+        pending.extend(
+            ResultRow(
+                match.source_file,
+                match.pattern_type,
+                match.match_value,
+                match.internal_path,
+                match.timestamp or "",
+            )
+            for match in event["matches"]
+        )
+        if len(pending) >= RESULT_BATCH_SIZE:
+            self._flush_rows()
+
+    def _flush_rows(self) -> None:
+        if self._pending_rows:
+            batch, self._pending_rows = self._pending_rows, []
+            self.signals.batch_ready.emit(batch)
+
+
+class ExportWorker(QRunnable):
+    """Write the results grid to JSON on a QThreadPool thread.
+
+    When the grid still holds exactly what the pipeline wrote, *source* is the
+    pipeline's JSON and it is copied with shutil.copyfile (kernel-side copy,
+    full report fields). Otherwise rows are serialised EXPORT_CHUNK_SIZE at a
+    time so neither a full list of dicts nor the whole document is in memory.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Sequence[str]],
+        row_count: int,
+        destination: Path,
+        source: Optional[Path] = None,
+    ) -> None:
+        super().__init__()
+        self.columns = columns
+        self.row_count = row_count
+        self.destination = destination
+        self.source = source
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            self.destination.parent.mkdir(parents=True, exist_ok=True)
+            if self.source is not None and self.source.exists():
+                shutil.copyfile(self.source, self.destination)
+            else:
+                self._write_rows()
+            self.signals.result.emit({"output": str(self.destination), "rows": self.row_count})
+        except Exception as exc:  # reported to the GUI; an exception escaping run() aborts the app
+            get_logger().exception("Erro ao exportar resultados para %s", self.destination)
+            self.signals.error.emit(str(exc))
+        finally:
+            self.signals.finished.emit()
+
+    def _write_rows(self) -> None:
+        with self.destination.open("w", encoding="utf-8") as handle:
+            handle.write("[")
+            separator = "\n"
+            for start in range(0, self.row_count, EXPORT_CHUNK_SIZE):
+                stop = min(start + EXPORT_CHUNK_SIZE, self.row_count)
+                chunk = zip(*(column[start:stop] for column in self.columns))
+                handle.write(separator)
+                handle.write(
+                    ",\n".join(
+                        json.dumps(dict(zip(ResultsModel.ATTRIBUTES, values)), ensure_ascii=False)
+                        for values in chunk
+                    )
+                )
+                separator = ",\n"
+            handle.write("\n]\n")
+
+
+def _batched(rows: Iterable[ResultRow], size: int) -> Iterator[List[ResultRow]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 class PrometheusWindow(QMainWindow):
     """Main GUI window for Prometheus with a modern, user-friendly layout."""
 
@@ -71,12 +488,30 @@ class PrometheusWindow(QMainWindow):
         self.input_edit = QLineEdit(self)
         self.config_edit = QLineEdit(self)
         self.progress_bar = QProgressBar(self)
-        self.status_label = QLabel("Pronto para iniciar.", self)
-        self.results_table = QTableWidget(self)
+        self.status_label = QLabel(IDLE_STATUS, self)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._reset_status)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._pending_progress: Optional[dict] = None
+        self.results_model = ResultsModel(self)
+        self.results_proxy = ResultsProxyModel(self)
+        self.results_table = QTableView(self)
         self.help_view = QTextBrowser(self)
+        self.run_button = QPushButton("Iniciar varredura", self)
         self.output_path = DEFAULT_OUTPUT_PATH
         self.csv_output_path: Optional[Path] = None
-        self.logger = configure_logging(verbose=False, log_path=DEFAULT_LOG_PATH)
+        # Pipeline JSON matching the grid contents, copied as-is on export.
+        self.json_output_path: Optional[Path] = None
+        self._scan_worker: Optional[ScanWorker] = None
+        self._export_worker: Optional[ExportWorker] = None
+        self._evidence_dir: Optional[Path] = None
+        self._config_file: Optional[Path] = None
+        self._current_scan: dict[str, object] = {"path": None, "total": 0}
+        self.logger = _gui_logger()
 
         self._build_ui()
         self._configure_table()
@@ -93,36 +528,14 @@ class PrometheusWindow(QMainWindow):
     def _apply_palette(self) -> None:
         """Apply a subtle neo-dark palette to give a modern feel."""
 
-        palette = QPalette()
-        background = QColor(30, 34, 45)
-        surface = QColor(40, 44, 55)
-        text = QColor(236, 239, 244)
-
-        palette.setColor(QPalette.ColorRole.Window, background)
-        palette.setColor(QPalette.ColorRole.Base, surface)
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(46, 50, 63))
-        palette.setColor(QPalette.ColorRole.Text, text)
-        palette.setColor(QPalette.ColorRole.WindowText, text)
-        palette.setColor(QPalette.ColorRole.Button, surface)
-        palette.setColor(QPalette.ColorRole.ButtonText, text)
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(110, 174, 236))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(16, 20, 29))
-
-        self.setPalette(palette)
-        self.setStyleSheet(
-            "QLineEdit, QTextBrowser { border: 1px solid #4f566b; border-radius: 6px; padding: 6px; }"
-            "QPushButton { background-color: #4c82ff; border-radius: 6px; padding: 8px 14px; color: #ecf0f4; }"
-            "QPushButton:hover { background-color: #386ef5; }"
-            "QGroupBox { border: 1px solid #4f566b; border-radius: 8px; margin-top: 12px; }"
-            "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 6px; }"
-            "QTableWidget { gridline-color: #3d4354; selection-background-color: #6eaef0; selection-color: #10141d; }"
-        )
+        self.setPalette(_dark_palette())
+        self.setStyleSheet(_STYLESHEET)
 
     def _apply_icon(self) -> None:
         """Load and apply the application icon when available."""
 
-        if APP_ICON_PATH.exists():
-            icon = QIcon(str(APP_ICON_PATH.resolve()))
+        icon = _get_app_icon()
+        if icon is not None:
             self.setWindowIcon(icon)
 
     def _build_ui(self) -> None:
@@ -157,7 +570,7 @@ class PrometheusWindow(QMainWindow):
         header_layout.addLayout(title_block, stretch=1)
 
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.status_label.setStyleSheet("color: #9aa3ba;")
+        self.status_label.setStyleSheet(f"color: {_STATUS_COLORS['info']};")
         header_layout.addWidget(self.status_label, stretch=0)
 
         return header
@@ -191,6 +604,8 @@ class PrometheusWindow(QMainWindow):
         form.setSpacing(10)
 
         self.input_edit.setPlaceholderText("Selecione o diretório de evidências (.ufdr)")
+        self.input_edit.textChanged.connect(self._forget_evidence_dir)
+        self._attach_path_completer(self.input_edit)
         browse_input = QPushButton("Procurar…", group)
         browse_input.clicked.connect(self._browse_input)
 
@@ -198,6 +613,8 @@ class PrometheusWindow(QMainWindow):
         form.addRow("Diretório de evidências", input_row)
 
         self.config_edit.setPlaceholderText("Arquivo de padrões (config/patterns.json)")
+        self.config_edit.textChanged.connect(self._forget_config_file)
+        self._attach_path_completer(self.config_edit, ["*.json"])
         browse_config = QPushButton("Procurar…", group)
         browse_config.clicked.connect(self._browse_config)
         config_row = self._combine_line_button(self.config_edit, browse_config)
@@ -210,13 +627,12 @@ class PrometheusWindow(QMainWindow):
         layout = QVBoxLayout(group)
         layout.setSpacing(10)
 
-        run_button = QPushButton("Iniciar varredura", group)
-        run_button.clicked.connect(self._start_scan)
+        self.run_button.clicked.connect(self._start_scan)
 
         open_patterns_button = QPushButton("Abrir patterns.json", group)
         open_patterns_button.clicked.connect(self._open_patterns_file)
 
-        layout.addWidget(run_button)
+        layout.addWidget(self.run_button)
         layout.addWidget(open_patterns_button)
 
         self.progress_bar.setRange(0, 100)
@@ -246,10 +662,12 @@ class PrometheusWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
 
-        tabs = QTabWidget(container)
-        tabs.addTab(self._build_results_tab(), "Resultados")
-        tabs.addTab(self._build_help_tab(), "Ajuda")
-        layout.addWidget(tabs)
+        self.tabs = QTabWidget(container)
+        self.tabs.addTab(self._build_results_tab(), "Resultados")
+        self._help_tab_index = self.tabs.addTab(self._build_help_tab(), "Ajuda")
+        # The help HTML is only laid out the first time its tab is opened.
+        self.tabs.currentChanged.connect(self._load_help)
+        layout.addWidget(self.tabs)
 
         return container
 
@@ -273,6 +691,18 @@ class PrometheusWindow(QMainWindow):
         layout.addWidget(self.help_view)
         return tab
 
+    def _attach_path_completer(self, line_edit: QLineEdit, name_filters: Optional[List[str]] = None) -> None:
+        # QFileSystemModel lists directories on a background thread and caches
+        # them, so typing a path never blocks like the native dialogs can.
+        model = QFileSystemModel(line_edit)
+        if name_filters:
+            model.setNameFilters(name_filters)
+            model.setNameFilterDisables(False)
+        model.setRootPath("")
+        completer = QCompleter(model, line_edit)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        line_edit.setCompleter(completer)
+
     def _combine_line_button(self, line_edit: QLineEdit, button: QPushButton) -> QWidget:
         container = QWidget(self)
         layout = QHBoxLayout(container)
@@ -283,266 +713,365 @@ class PrometheusWindow(QMainWindow):
         return container
 
     def _configure_table(self) -> None:
-        headers = ["Arquivo", "Tipo", "Valor", "Caminho Interno", "Timestamp"]
-        self.results_table.setColumnCount(len(headers))
-        self.results_table.setHorizontalHeaderLabels(headers)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setFilterKeyColumn(ResultsModel.ATTRIBUTES.index("pattern_type"))
+        self.results_table.setModel(self.results_proxy)
+        self.results_table.setItemDelegate(ResultsDelegate(self.results_table))
         self.results_table.verticalHeader().setVisible(False)
-        self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.results_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSortingEnabled(True)
+        # Fixed row heights and interactive widths: Stretch recomputes every
+        # column on each resize and insert, which dominates bulk appends.
+        rows_header = self.results_table.verticalHeader()
+        rows_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows_header.setDefaultSectionSize(self.fontMetrics().height() + 10)
         header = self.results_table.horizontalHeader()
-        for index in range(len(headers)):
-            header.setSectionResizeMode(index, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for index, width in enumerate(RESULT_COLUMN_WIDTHS):
+            header.resizeSection(index, width)
+        header.setStretchLastSection(True)
 
     def _configure_help(self) -> None:
         self.help_view.setOpenExternalLinks(True)
         self.help_view.setReadOnly(True)
         self.help_view.setStyleSheet("background-color: #262b39; color: #d5daec;")
-        self.help_view.setHtml(self._build_help_text())
-
-    def _build_help_text(self) -> str:
-        patterns_path = DEFAULT_PATTERNS_PATH.resolve()
-        return f"""
-        <h2 style='color:#eff3ff;'>Guia Rápido</h2>
-        <p>A Prometheus Forensic Tool automatiza a análise de pacotes <code>.ufdr</code>:
-        encontra arquivos, extrai dados internos e aplica padrões de regex configuráveis
-        para gerar um relatório consolidado.</p>
-
-        <h3 style='color:#eff3ff;'>Fluxo de Trabalho</h3>
-        <ol>
-            <li>Escolha o diretório de evidências com os arquivos <code>.ufdr</code>.</li>
-            <li>Selecione o arquivo de padrões (por padrão: <code>{patterns_path}</code>).</li>
-            <li>Inicie a varredura. O pipeline definitivo consolidará todos os resultados em um único JSON.</li>
-        </ol>
-
-        <h3 style='color:#eff3ff;'>Padrões Regex</h3>
-        <p>Os padrões ficam em <code>config/patterns.json</code>. Cada entrada contém:</p>
-        <ul>
-            <li><b>name</b>: identificador do padrão (ex.: <code>CPF</code>).</li>
-            <li><b>regex</b>: expressão regular usada na busca.</li>
-            <li><b>flags</b> (opcional): lista com <code>ignorecase</code>, <code>multiline</code>, <code>dotall</code> ou <code>unicode</code>.</li>
-        </ul>
-        <p>Use o botão "Abrir patterns.json" para revisar ou editar o arquivo padrão.</p>
-
-        <h3 style='color:#eff3ff;'>Módulos Implementados</h3>
-        <ul>
-            <li><code>scanner.py</code>: busca recursiva por <code>.ufdr</code> (F1).</li>
-            <li><code>extractor.py</code>: trata <code>.ufdr</code> como arquivos <i>zip</i> (F2).</li>
-            <li><code>regex_engine.py</code>: executa os padrões configurados (F4).</li>
-            <li><code>cli.py</code>: interface de linha de comando (F7).</li>
-            <li><code>gui.py</code>: esta interface moderna em PyQt6 (F8).</li>
-        </ul>
-
-        <h3 style='color:#eff3ff;'>Status do Projeto</h3>
-        <p>O pipeline completo ainda será integrado em <code>run_pipeline</code>. Até lá, use os módulos individuais
-        para validar resultados ou experimentar com dados de teste.</p>
-
-        <p style='margin-top:16px;color:#a7b2d6;'>Desenvolvido por Matheus C. Pestana (GENI/UFF).</p>
-        """
+
+    def _load_help(self, index: int) -> None:
+        if index != self._help_tab_index:
+            return
+        self.tabs.currentChanged.disconnect(self._load_help)
+        self.help_view.setHtml(_help_html())
 
     def _load_default_paths(self) -> None:
-        if DEFAULT_PATTERNS_PATH.exists():
-            self.config_edit.setText(str(DEFAULT_PATTERNS_PATH.resolve()))
+        if _DEFAULT_PATTERNS_PATH_RESOLVED.exists():
+            self.config_edit.setText(str(_DEFAULT_PATTERNS_PATH_RESOLVED))
+            self._config_file = _DEFAULT_PATTERNS_PATH_RESOLVED
 
     # --------------------------------------------------------------- Actions ---
+    def _forget_evidence_dir(self) -> None:
+        self._evidence_dir = None
+
+    def _forget_config_file(self) -> None:
+        self._config_file = None
+
+    def _open_file_dialog(
+        self,
+        title: str,
+        file_mode: QFileDialog.FileMode,
+        on_selected: Callable[[str], None],
+        *,
+        directory: str = "",
+        name_filter: Optional[str] = None,
+        save: bool = False,
+    ) -> QFileDialog:
+        """Open a window-modal Qt file dialog and call *on_selected* with the chosen path.
+
+        The static QFileDialog helpers run a nested event loop around the
+        platform dialog, which can stall or deadlock with some GTK/portal
+        setups; this dialog is drawn by Qt and returns through fileSelected.
+        """
+
+        dialog = QFileDialog(self, title, directory)
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        dialog.setFileMode(file_mode)
+        if file_mode == QFileDialog.FileMode.Directory:
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        if name_filter:
+            dialog.setNameFilter(name_filter)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setDefaultSuffix("json")
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
+        return dialog
+
     def _browse_input(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Selecionar diretório de evidências")
+        self._open_file_dialog(
+            "Selecionar diretório de evidências", QFileDialog.FileMode.Directory, self._on_input_selected
+        )
+
+    def _on_input_selected(self, directory: str) -> None:
         if directory:
             self.input_edit.setText(directory)
+            # Set after setText: textChanged clears the cached path.
+            self._evidence_dir = Path(directory).expanduser().resolve()
 
     def _browse_config(self) -> None:
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        self._open_file_dialog(
             "Selecionar arquivo de padrões",
-            str(DEFAULT_PATTERNS_PATH.parent.resolve()),
-            "JSON (*.json)",
+            QFileDialog.FileMode.ExistingFile,
+            self._on_config_selected,
+            directory=str(_DEFAULT_PATTERNS_PATH_RESOLVED.parent),
+            name_filter="JSON (*.json)",
         )
+
+    def _on_config_selected(self, file_path: str) -> None:
         if file_path:
             self.config_edit.setText(file_path)
+            self._config_file = Path(file_path).expanduser().resolve()
 
-    def _start_scan(self) -> None:
-        evidence_dir = Path(self.input_edit.text()).expanduser()
-        config_text = self.config_edit.text().strip()
-        config_file: Optional[Path] = Path(config_text).expanduser() if config_text else None
+    def _validate_inputs(self) -> ScanInputs:
+        """Resolve and check the scan inputs, raising ScanInputError when invalid."""
 
-        if not evidence_dir.exists() or not evidence_dir.is_dir():
-            QMessageBox.warning(self, "Entrada inválida", "Selecione um diretório de evidências válido.")
-            return
+        # Paths picked through the dialogs are already resolved; typed text is
+        # converted here. Each path is then checked with a single stat call.
+        evidence_dir = self._evidence_dir or Path(self.input_edit.text()).expanduser()
+        config_file = self._config_file
+        if config_file is None:
+            config_text = self.config_edit.text().strip()
+            config_file = Path(config_text).expanduser() if config_text else None
 
-        if config_file and not config_file.exists():
-            QMessageBox.warning(self, "Configuração inválida", "Selecione um arquivo de padrões válido.")
-            return
+        if not evidence_dir.is_dir():
+            raise ScanInputError("Entrada inválida", "Selecione um diretório de evidências válido.")
 
-        effective_config = config_file or DEFAULT_PATTERNS_PATH
+        effective_config = config_file or _DEFAULT_PATTERNS_PATH_RESOLVED
         if not effective_config.exists():
-            QMessageBox.warning(
-                self,
+            if config_file:
+                raise ScanInputError("Configuração inválida", "Selecione um arquivo de padrões válido.")
+            raise ScanInputError(
                 "Configuração ausente",
                 "O arquivo de padrões não foi localizado. Ajuste o caminho em \"Fontes de dados\".",
             )
+        return ScanInputs(evidence_dir, effective_config)
+
+    def _start_scan(self) -> None:
+        if self._scan_worker is not None:
+            return
+        try:
+            evidence_dir, effective_config = self._validate_inputs()
+        except ScanInputError as exc:
+            QMessageBox.warning(self, exc.title, str(exc))
             return
 
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.results_table.setRowCount(0)
+        self.results_model.set_rows([])
+        self.json_output_path = None
         self.progress_bar.setRange(0, 0)
         self.progress_bar.setFormat("Preparando execução…")
-        self.status_label.setText("Executando varredura…")
+        self._show_status("Executando varredura…", timeout_ms=0)
+        self.run_button.setEnabled(False)
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         self.logger.info("Varredura iniciada via GUI: input=%s config=%s output=%s", evidence_dir, effective_config, self.output_path)
 
-        success = False
-        current_file: dict[str, object] = {"path": None, "total": 0}
-        csv_path: Optional[str] = None
-
-        def handle_progress(event: dict) -> None:
-            event_type = event.get("type")
-            path_str = event.get("path")
-            if not event_type or not path_str:
-                return
-
-            ufdr_name = Path(path_str).name
-
-            if event_type == "ufdr-start":
-                total = int(event.get("textual_total") or 0)
-                current_file["path"] = path_str
-                current_file["total"] = total
-                if total > 0:
-                    self.progress_bar.setRange(0, total)
-                    self.progress_bar.setValue(0)
-                    self.progress_bar.setFormat(f"{ufdr_name}: 0/{total}")
-                else:
-                    self.progress_bar.setRange(0, 1)
-                    self.progress_bar.setValue(1)
-                    self.progress_bar.setFormat(f"{ufdr_name}: sem arquivos textuais")
-                self.status_label.setText(f"Processando {ufdr_name}…")
-            elif event_type == "text-progress":
-                total = int(event.get("total") or current_file.get("total") or 1)
-                index = int(event.get("index") or 0)
-                engine = event.get("engine") or event.get("stage") or ""
-                self.progress_bar.setRange(0, total)
-                self.progress_bar.setValue(min(index, total))
-                self.progress_bar.setFormat(f"{ufdr_name}: {index}/{total} via {engine}")
-                self.status_label.setText(f"{ufdr_name}: {index}/{total} via {engine}")
-            elif event_type == "ufdr-complete":
-                self.status_label.setText(f"Concluído {ufdr_name}")
+        self._current_scan = {"path": None, "total": 0}
+        worker = ScanWorker(evidence_dir, effective_config, self.output_path)
+        worker.signals.progress.connect(self._on_scan_progress)
+        worker.signals.batch_ready.connect(self.append_results)
+        worker.signals.result.connect(self._on_scan_result)
+        worker.signals.error.connect(self._on_scan_error)
+        worker.signals.finished.connect(self._on_scan_finished)
+        self._scan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scan_progress(self, event: dict) -> None:
+        # text-progress arrives once per member; keep only the latest and
+        # repaint at most every PROGRESS_FLUSH_MS. Other events flush first so
+        # the display never goes backwards.
+        if event.get("type") == "text-progress":
+            self._pending_progress = event
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+            return
+        self._flush_progress()
+        self._apply_progress(event)
+
+    def _flush_progress(self) -> None:
+        self._progress_timer.stop()
+        event, self._pending_progress = self._pending_progress, None
+        if event is not None:
+            self._apply_progress(event)
+
+    def _apply_progress(self, event: dict) -> None:
+        event_type = event.get("type")
+        path_str = event.get("path")
+        if not event_type or not path_str:
+            return
 
-        try:
-            summary = run_pipeline(
-                input_dir=evidence_dir,
-                config_path=effective_config,
-                output_path=self.output_path,
-                progress_callback=handle_progress,
-            )
-            success = True
-            csv_path = summary.get("csv_output")
-            if csv_path:
-                self.csv_output_path = Path(csv_path)
-
-            if self.output_path.exists():
-                with self.output_path.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
+        ufdr_name = Path(path_str).name
+        current_file = self._current_scan
+
+        if event_type == "ufdr-start":
+            total = int(event.get("textual_total") or 0)
+            current_file["path"] = path_str
+            current_file["total"] = total
+            if total > 0:
+                self.progress_bar.setRange(0, total)
+                self.progress_bar.setValue(0)
+                self.progress_bar.setFormat(f"{ufdr_name}: 0/{total}")
             else:
-                data = []
-
-            rows = [
-                ResultRow(
-                    source_file=str(entry.get("source_file", "")),
-                    pattern_type=str(entry.get("pattern_type", "")),
-                    match_value=str(entry.get("match_value", "")),
-                    internal_path=str(entry.get("internal_path", "")),
-                    timestamp=str(entry.get("timestamp", "")),
-                )
-                for entry in data
-            ]
-            self.populate_results(rows)
-
-            processed = int(summary.get("processed", 0))
-            matches = int(summary.get("matches", 0))
-            failures_raw = summary.get("failures", []) or []
-            failures = [Path(item).name if item else "" for item in failures_raw]
-
-            self.progress_bar.setRange(0, 1)
-            self.progress_bar.setValue(1)
-            self.progress_bar.setFormat("Varredura concluída")
-            self.status_label.setText(
-                f"Processados: {processed} | Ocorrências: {matches} | Falhas: {len(failures)}"
-            )
+                self.progress_bar.setRange(0, 1)
+                self.progress_bar.setValue(1)
+                self.progress_bar.setFormat(f"{ufdr_name}: sem arquivos textuais")
+            self.status_label.setText(f"Processando {ufdr_name}…")
+        elif event_type == "text-progress":
+            total = int(event.get("total") or current_file.get("total") or 1)
+            index = int(event.get("index") or 0)
+            engine = event.get("engine") or event.get("stage") or ""
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(min(index, total))
+            self.progress_bar.setFormat(f"{ufdr_name}: {index}/{total} via {engine}")
+            self.status_label.setText(f"{ufdr_name}: {index}/{total} via {engine}")
+        elif event_type == "ufdr-complete":
+            self.status_label.setText(f"Concluído {ufdr_name}")
+
+    def _on_scan_result(self, summary: dict) -> None:
+        self._flush_progress()
+        output = summary.get("output")
+        self.json_output_path = Path(output) if output else None
+        csv_path = summary.get("csv_output")
+        if csv_path:
+            self.csv_output_path = Path(csv_path)
+            self.logger.info("Resultado CSV disponível em %s", csv_path)
+        self.results_model.finalize()
+        self._apply_sort()
+
+        processed = int(summary.get("processed", 0))
+        matches = int(summary.get("matches", 0))
+        failures_raw = summary.get("failures", []) or []
+        failures = [Path(item).name if item else "" for item in failures_raw]
+
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+        self.progress_bar.setFormat("Varredura concluída")
+
+        self.logger.info(
+            "Varredura concluída. Processados=%s ocorrencias=%s falhas=%s",
+            processed,
+            matches,
+            failures_raw,
+        )
 
-            self.logger.info(
-                "Varredura concluída. Processados=%s ocorrencias=%s falhas=%s",
-                processed,
-                matches,
-                failures_raw,
-            )
+        details_lines = [
+            f"{processed} arquivo(s) processado(s).",
+            f"{matches} ocorrência(s) identificada(s).",
+        ]
+        if failures:
+            details_lines.append("Falhas:")
+            details_lines.extend(f"- {name or '(desconhecido)'}" for name in failures)
+        # The summary stays visible until the next action; details go to the tooltip.
+        self._show_status(
+            f"Processados: {processed} | Ocorrências: {matches} | Falhas: {len(failures)}",
+            "error" if failures else "success",
+            timeout_ms=0,
+        )
+        self.status_label.setToolTip("\n".join(details_lines))
 
-            details_lines = [
-                f"{processed} arquivo(s) processado(s).",
-                f"{matches} ocorrência(s) identificada(s).",
-            ]
-            if failures:
-                details_lines.append("Falhas:")
-                details_lines.extend(f"- {name or '(desconhecido)'}" for name in failures)
-            QMessageBox.information(self, "Varredura concluída", "\n".join(details_lines))
-        except Exception as exc:  # pragma: no cover - GUI flow
-            self.logger.exception("Erro ao executar a varredura")
-            QMessageBox.critical(
-                self,
-                "Erro na varredura",
-                f"Falha ao executar o pipeline:\n{exc}",
-            )
-            self.status_label.setText("Falha na execução. Verifique os logs.")
-        finally:
-            QApplication.restoreOverrideCursor()
-            if not success:
-                self.progress_bar.setValue(0)
-                self.progress_bar.setFormat("Aguardando execução…")
-            elif csv_path:
-                self.logger.info("Resultado CSV disponível em %s", csv_path)
+    def _on_scan_error(self, message: str) -> None:
+        self._flush_progress()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Aguardando execução…")
+        self._show_status("Falha na execução. Verifique os logs.", "error", timeout_ms=0)
+        QMessageBox.critical(
+            self,
+            "Erro na varredura",
+            f"Falha ao executar o pipeline:\n{message}",
+        )
+
+    def _on_scan_finished(self) -> None:
+        QApplication.restoreOverrideCursor()
+        self.run_button.setEnabled(True)
+        self._scan_worker = None
 
     def _open_patterns_file(self) -> None:
-        if not DEFAULT_PATTERNS_PATH.exists():
-            QMessageBox.information(self, "Arquivo ausente", "O arquivo config/patterns.json ainda não existe.")
+        if not _DEFAULT_PATTERNS_PATH_RESOLVED.exists():
+            self._show_status("O arquivo config/patterns.json ainda não existe.", "error")
             return
-        QDesktopServices.openUrl(QUrl.fromLocalFile(str(DEFAULT_PATTERNS_PATH.resolve())))
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(_DEFAULT_PATTERNS_PATH_RESOLVED)))
 
     def _export_results(self) -> None:
-        if self.results_table.rowCount() == 0:
-            QMessageBox.information(self, "Sem dados", "Não há resultados para exportar no momento.")
-            return
-
-        if not self.output_path.exists():
-            QMessageBox.information(
-                self,
-                "Sem arquivo",
-                "Execute uma varredura antes de exportar. O arquivo de resultados não foi encontrado.",
-            )
+        if self.results_model.rowCount() == 0:
+            self._show_status("Não há resultados para exportar no momento.", "error")
             return
 
-        target, _ = QFileDialog.getSaveFileName(self, "Salvar resultados", filter="JSON (*.json)")
-        if not target:
-            return
+        self._open_file_dialog(
+            "Salvar resultados",
+            QFileDialog.FileMode.AnyFile,
+            self._on_export_target_selected,
+            name_filter="JSON (*.json)",
+            save=True,
+        )
 
-        destination = Path(target).expanduser()
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(self.output_path.read_text(encoding="utf-8"), encoding="utf-8")
+    def _on_export_target_selected(self, target: str) -> None:
+        if target:
+            self._start_export(Path(target).expanduser())
 
-        QMessageBox.information(
-            self,
-            "Exportação concluída",
-            f"Resultados exportados para {destination}.",
+    def _start_export(self, destination: Path) -> None:
+        worker = ExportWorker(
+            self.results_model.columns(), self.results_model.rowCount(), destination, self.json_output_path
         )
+        worker.signals.result.connect(self._on_export_result)
+        worker.signals.error.connect(self._on_export_error)
+        self._export_worker = worker
+        self._show_status("Exportando resultados…", timeout_ms=0)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_result(self, summary: dict) -> None:
+        self._export_worker = None
+        self._show_status(f"Resultados exportados para {summary['output']}.", "success")
+
+    def _on_export_error(self, message: str) -> None:
+        self._export_worker = None
+        self._show_status(f"Falha ao exportar resultados: {message}", "error")
 
     # ------------------------------------------------------------- Helpers ---
-    def populate_results(self, rows: List[ResultRow]) -> None:
-        """Fill the results table with pre-collected rows (used in tests/demo)."""
+    def _show_status(self, message: str, level: str = "info", *, timeout_ms: int = STATUS_RESET_MS) -> None:
+        """Show *message* in the header banner instead of a modal dialog.
+
+        The banner returns to the idle text after *timeout_ms* (0 keeps it).
+        """
+
+        self.status_label.setText(message)
+        self.status_label.setToolTip("")
+        self.status_label.setStyleSheet(f"color: {_STATUS_COLORS.get(level, _STATUS_COLORS['info'])};")
+        self._status_timer.stop()
+        if timeout_ms > 0:
+            self._status_timer.start(timeout_ms)
+
+    def _reset_status(self) -> None:
+        self._show_status(IDLE_STATUS, timeout_ms=0)
+
+    def populate_results(self, rows: Iterable[ResultRow]) -> None:
+        """Fill the results table from a list or a stream of rows.
+
+        Lists are loaded with a single model reset; other iterables are fed in
+        RESULT_BATCH_SIZE chunks so the view can paint between batches. Either
+        way the header's sort order is applied once at the end.
+        """
+
+        self.json_output_path = None
+        if isinstance(rows, Sequence):
+            self.results_model.set_rows(rows)
+        else:
+            self.results_model.set_rows([])
+            for batch in _batched(rows, RESULT_BATCH_SIZE):
+                self.append_results(batch)
+        self._apply_sort()
+
+    def append_results(self, rows: List[ResultRow]) -> None:
+        """Append a batch of rows at the end without re-sorting.
+
+        Streamed batches only notify the inserted range; the sort order is
+        re-applied once when the scan finishes (see _apply_sort).
+        """
+
+        self.results_model.extend(rows)
+
+    def _apply_sort(self) -> None:
+        """Sort once by the header's current sort column, if sorting is enabled."""
+
+        view = self.results_table
+        if view.isSortingEnabled():
+            header = view.horizontalHeader()
+            view.sortByColumn(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+    def filter_results(self, pattern_type: str) -> None:
+        """Show only rows of the given pattern type (empty string shows all)."""
 
-        self.results_table.setRowCount(len(rows))
-        for row_index, row in enumerate(rows):
-            for column_index, value in enumerate(
-                [row.source_file, row.pattern_type, row.match_value, row.internal_path, row.timestamp]
-            ):
-                self.results_table.setItem(row_index, column_index, QTableWidgetItem(value))
+        self.results_proxy.setFilterFixedString(pattern_type)
 
     # --------------------------------------------------------------- Entry ---
 
@@ -566,7 +1095,7 @@ def _cleanup_application() -> None:
 
 def _signal_handler(signum, frame) -> None:
     """Handle termination signals gracefully."""
-    logger = configure_logging(verbose=False, log_path=DEFAULT_LOG_PATH)
+    logger = _gui_logger()
     logger.info("Received signal %d, cleaning up...", signum)
     _cleanup_application()
     sys.exit(0)
@@ -576,7 +1105,7 @@ def run_gui() -> None:
     """Launch the PyQt6 application."""
     # Qt plugins are already configured at module import time via configure_qt_plugins()
     # But we need to ensure QApplication is created with the correct plugin paths
-    logger = configure_logging(verbose=False, log_path=DEFAULT_LOG_PATH)
+    logger = _gui_logger()
     
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, _signal_handler)
@@ -600,8 +1129,8 @@ def run_gui() -> None:
         plugin_path_str = str(plugin_path.resolve())
         QCoreApplication.setLibraryPaths([plugin_path_str])
 
-    if APP_ICON_PATH.exists():
-        icon = QIcon(str(APP_ICON_PATH.resolve()))
+    icon = _get_app_icon()
+    if icon is not None:
         app.setWindowIcon(icon)
 
     window = PrometheusWindow()
@@ -2,28 +2,177 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Callable, Iterable, List, TypeVar
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 LOG_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
 DEFAULT_LOG_PATH = Path("outputs/logs/scan.log")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+LOG_BUFFER_SIZE = 128 * 1024
+# Seconds between execute_with_resilience poll() calls while pool workers run.
+POLL_INTERVAL = 0.05
 
+# (verbose, log_path, max_bytes, backup_count, rotate) of the handlers currently attached to the Prometheus logger.
+_active_configuration: tuple[bool, Path, int, int, bool] | None = None
 
-def configure_logging(*, verbose: bool = False, log_path: Path | str = DEFAULT_LOG_PATH) -> logging.Logger:
-    """Configure the Prometheus logger with file + console handlers."""
 
-    log_path = Path(log_path).expanduser()
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its owner instead of every record.
+
+    The stream is opened with a large buffer, so a burst of records costs one
+    ``write()`` syscall per buffer instead of one per line. Flushing happens
+    on :meth:`flush`/:meth:`close`; the queue listener flushes whenever its
+    queue runs empty.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Buffered variant of RotatingFileHandler.
 
+    The stock handler seeks to the end of the file on every record to check
+    its size, which also flushes the buffer. This one keeps a running count of
+    the characters written instead (approximate for non-ASCII text).
+    """
+
+    _stream_size = 0
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+        self._stream_size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._stream_size and self._stream_size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._stream_size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if self.queue.empty():
+            for handler in self.handlers:
+                # Same tolerance as logging.shutdown: a closed stream must not kill the listener thread.
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass
+        return super().dequeue(block)
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """QueueHandler that owns the QueueListener writing its records.
+
+    Logging threads only enqueue records; file and console output happen on
+    the listener thread. ``flush`` waits until the queue is drained so callers
+    can still rely on the log file being up to date.
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        super().__init__(queue.Queue(-1))
+        self.listener = _FlushingQueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def flush(self) -> None:
+        if self.listener._thread is not None:
+            self.queue.join()
+        for handler in self.listener.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        super().close()
+
+
+def _close_handlers() -> None:
     logger = logging.getLogger("prometheus")
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
+atexit.register(_close_handlers)
+
+
+def configure_logging(
+    *,
+    verbose: bool = False,
+    log_path: Path | str = DEFAULT_LOG_PATH,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    rotate: bool = True,
+) -> logging.Logger:
+    """Configure the Prometheus logger with file + console handlers.
+
+    Long-running front-ends keep the default size-based rotation; one-shot
+    batch runs can pass ``rotate=False`` to use a plain ``FileHandler``, which
+    skips the per-record size check.
+
+    Both handlers run on a background QueueListener, so log calls from the
+    scan loop only pay for a queue put. Repeated calls with the same settings reuse the handlers already attached
+    instead of reopening the log file.
+    """
+
+    global _active_configuration
+
+    log_path = Path(log_path).expanduser()
+    logger = logging.getLogger("prometheus")
+    configuration = (verbose, log_path, max_bytes, backup_count, rotate)
+    if _active_configuration == configuration and logger.handlers:
+        return logger
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
     logger.setLevel(logging.DEBUG)
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
-    file_handler = RotatingFileHandler(log_path, maxBytes=1_048_576, backupCount=3, encoding="utf-8")
+    file_handler: logging.FileHandler
+    if rotate:
+        file_handler = BufferedRotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    else:
+        file_handler = BufferedFileHandler(log_path, encoding="utf-8")
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
     file_handler.setLevel(logging.DEBUG)
 
@@ -31,10 +180,10 @@ def configure_logging(*, verbose: bool = False, log_path: Path | str = DEFAULT_L
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(_ListenerQueueHandler(file_handler, console_handler))
+    _active_configuration = configuration
 
-    logger.debug("Logging configured. verbose=%s log_path=%s", verbose, log_path)
+    logger.debug("Logging configured. verbose=%s log_path=%s rotate=%s", verbose, log_path, rotate)
     return logger
 
 
@@ -47,19 +196,56 @@ def get_logger() -> logging.Logger:
 def execute_with_resilience(
     items: Iterable[T],
     *,
-    action: Callable[[T], None],
+    action: Callable[[T], R],
     on_error: Callable[[T, Exception], None] | None = None,
+    on_result: Callable[[T, R], None] | None = None,
+    max_workers: int | None = 1,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+    poll: Callable[[], None] | None = None,
 ) -> List[T]:
-    """Execute *action* for each item, logging errors and returning failed items."""
+    """Execute *action* for each item, logging errors and returning failed items.
+
+    With ``max_workers`` other than 1 the items run in a ProcessPoolExecutor
+    (``None`` uses every core), so *action* must be picklable; *initializer*
+    and *initargs* are forwarded to the pool. Results and errors are still
+    handled in the calling process, in completion order, and *poll* is called
+    there periodically while workers are busy.
+    """
 
     logger = get_logger()
     failures: List[T] = []
-    for item in items:
-        try:
-            action(item)
-        except Exception as exc:  # pragma: no cover - defensive path tested separately
-            failures.append(item)
-            if on_error:
-                on_error(item, exc)
-            logger.exception("Falha ao processar %s", item)
+
+    def handle_error(item: T, exc: Exception) -> None:
+        failures.append(item)
+        if on_error:
+            on_error(item, exc)
+        logger.exception("Falha ao processar %s", item)
+
+    if max_workers == 1:
+        for item in items:
+            try:
+                result = action(item)
+            except Exception as exc:  # pragma: no cover - defensive path tested separately
+                handle_error(item, exc)
+            else:
+                if on_result:
+                    on_result(item, result)
+        return failures
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as executor:
+        pending = {executor.submit(action, item): item for item in items}
+        while pending:
+            done, _ = wait(pending, timeout=POLL_INTERVAL if poll else None, return_when=FIRST_COMPLETED)
+            if poll:
+                poll()
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    handle_error(item, exc)
+                else:
+                    if on_result:
+                        on_result(item, result)
     return failures
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import queue
 from datetime import datetime
+from functools import cache, partial
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from src.content_navigator import EvidencePayload, UFDRContentNavigator
-from src.forensics import build_evidence_match
+from src.forensics import build_evidence_matches
 from src.logger import execute_with_resilience, get_logger
 from src.models import EvidenceMatch
 from src.regex_engine import RegexEngine
@@ -26,11 +30,24 @@ def run_pipeline(
     *,
     progress_callback: Optional[ProgressCallback] = None,
     allowed_extensions: Optional[set[str]] = None,
+    ufdr_paths: Optional[Sequence[Path]] = None,
+    stream_matches: bool = False,
+    max_workers: Optional[int] = 1,
 ) -> Dict[str, object]:
-    """Execute the complete Prometheus processing pipeline (F10)."""
+    """Execute the complete Prometheus processing pipeline (F10).
+
+    Callers that already scanned ``input_dir`` can pass ``ufdr_paths`` so the
+    directory tree is not walked a second time. With ``stream_matches`` the
+    progress callback also receives a ``"matches"`` event carrying the
+    EvidenceMatch list of every payload that matched.
+
+    ``max_workers`` other than 1 scans the UFDR files in parallel worker
+    processes (``None`` uses every core). Their progress events and log
+    records are relayed to the calling thread, and matches are written as
+    each file completes.
+    """
 
     logger = get_logger()
-    scanner = UFDRScanner(input_dir)
     
     # Generate timestamp for output files
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -49,53 +66,89 @@ def run_pipeline(
     logger.debug("Configuração de padrões: %s", config_path)
     logger.debug("Arquivo de saída: %s", output_path)
     
-    scan_results = scanner.scan()
-    ufdr_paths = [result.path for result in scan_results]
+    if ufdr_paths is None:
+        ufdr_paths = UFDRScanner.list_paths(UFDRScanner(input_dir).scan())
+    else:
+        ufdr_paths = list(ufdr_paths)
     logger.info("%d arquivo(s) .ufdr encontrado(s)", len(ufdr_paths))
     
     # Log detalhado dos arquivos encontrados (sempre mostrar, não só em debug)
     if ufdr_paths:
         logger.info("Arquivos encontrados:")
-        for idx, result in enumerate(scan_results, 1):
-            logger.info("  [%d/%d] %s", idx, len(ufdr_paths), result.path)
+        for idx, path in enumerate(ufdr_paths, 1):
+            logger.info("  [%d/%d] %s", idx, len(ufdr_paths), path)
     else:
         logger.warning("Nenhum arquivo .ufdr encontrado em %s", input_dir)
 
+    stream = stream_matches and progress_callback is not None
+
     def emit(event: Dict[str, object]) -> None:
         if progress_callback:
             progress_callback(event)
 
-    def process_file(path: Path) -> None:
-        navigator = UFDRContentNavigator(path, allowed_extensions=allowed_extensions)
-        plan = navigator.plan_processing()
-        emit(
-            {
-                "type": "ufdr-start",
-                "path": str(path),
-                "textual_total": len(plan.textual_members),
-            }
-        )
+    def on_matches(path: Path, matches: List[EvidenceMatch]) -> None:
+        reporter.extend_matches(matches)
+        if stream and matches:
+            emit({"type": "matches", "path": str(path), "matches": matches})
 
-        def on_text_progress(event) -> None:
-            emit(
-                {
-                    "type": "text-progress",
-                    "path": str(path),
-                    "member": event.member.name,
-                    "index": event.index,
-                    "total": event.total,
-                    "stage": event.stage,
-                    "engine": event.engine,
-                }
-            )
-
-        for payload in navigator.collect_payloads(plan=plan, progress_callback=on_text_progress):
-            matches = _run_regex(regex_engine, payload)
-            reporter.extend_matches(matches)
+    def process_file(path: Path) -> None:
+        _scan_ufdr(path, regex_engine, allowed_extensions=allowed_extensions, emit=emit, on_matches=on_matches)
+        emit({"type": "ufdr-complete", "path": str(path)})
 
+    def on_worker_result(path: Path, matches: List[EvidenceMatch]) -> None:
+        drain_worker_events()
+        on_matches(path, matches)
         emit({"type": "ufdr-complete", "path": str(path)})
 
-    failures = execute_with_resilience(ufdr_paths, action=process_file)
+    def on_worker_error(path: Path, exc: Exception) -> None:
+        # Keep what the worker found before failing, as the sequential path does.
+        drain_worker_events()
+        if isinstance(exc, PartialScanError):
+            on_matches(path, exc.matches)
+
+    def drain_worker_events() -> None:
+        while True:
+            try:
+                item = worker_events.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, logging.LogRecord):
+                logger.handle(item)
+            else:
+                emit(item)
+
+    # Matches go straight to disk as they are found instead of piling up in memory.
+    reporter.open()
+    try:
+        if max_workers == 1 or len(ufdr_paths) < 2:
+            failures = execute_with_resilience(ufdr_paths, action=process_file)
+        else:
+            # Workers inherit the logger on fork; flush it so buffered records are not written twice.
+            for handler in logger.handlers:
+                handler.flush()
+            worker_events = multiprocessing.Queue()
+            try:
+                failures = execute_with_resilience(
+                    ufdr_paths,
+                    action=partial(
+                        _scan_ufdr_in_worker,
+                        config_path=config_path,
+                        allowed_extensions=allowed_extensions,
+                        relay_progress=progress_callback is not None,
+                    ),
+                    on_result=on_worker_result,
+                    on_error=on_worker_error,
+                    max_workers=max_workers,
+                    initializer=_init_scan_worker,
+                    initargs=(worker_events,),
+                    poll=drain_worker_events,
+                )
+                drain_worker_events()
+            finally:
+                worker_events.close()
+    except BaseException:
+        reporter.discard()
+        raise
 
     outputs = reporter.write()
     logger.info(
@@ -116,10 +169,103 @@ def run_pipeline(
     }
 
 
+def _scan_ufdr(
+    path: Path,
+    regex_engine: RegexEngine,
+    *,
+    allowed_extensions: Optional[set[str]],
+    emit: ProgressCallback,
+    on_matches: Callable[[Path, List[EvidenceMatch]], None],
+) -> None:
+    navigator = UFDRContentNavigator(path, allowed_extensions=allowed_extensions)
+    plan = navigator.plan_processing()
+    emit(
+        {
+            "type": "ufdr-start",
+            "path": str(path),
+            "textual_total": len(plan.textual_members),
+        }
+    )
+
+    def on_text_progress(event) -> None:
+        emit(
+            {
+                "type": "text-progress",
+                "path": str(path),
+                "member": event.member.name,
+                "index": event.index,
+                "total": event.total,
+                "stage": event.stage,
+                "engine": event.engine,
+            }
+        )
+
+    for payload in navigator.collect_payloads(plan=plan, progress_callback=on_text_progress):
+        on_matches(path, _run_regex(regex_engine, payload))
+
+
+class PartialScanError(Exception):
+    """A pool worker failed mid-file; ``matches`` holds what it found before."""
+
+    def __init__(self, message: str, matches: List[EvidenceMatch]) -> None:
+        # Both values go in args so the exception pickles back to the parent.
+        super().__init__(message, matches)
+        self.matches = matches
+
+    def __str__(self) -> str:
+        return str(self.args[0])
+
+
+# Queue shared with the parent process while running as a pool worker.
+_worker_events: Optional[multiprocessing.Queue] = None
+
+
+def _init_scan_worker(events: multiprocessing.Queue) -> None:
+    global _worker_events
+    _worker_events = events
+    # Log records go back to the parent, which owns the log file and console.
+    logging.getLogger("prometheus").handlers = [QueueHandler(events)]
+
+
+@cache
+def _worker_regex_engine(config_path: Path) -> RegexEngine:
+    return RegexEngine.from_config(config_path)
+
+
+def _scan_ufdr_in_worker(
+    path: Path,
+    *,
+    config_path: Path,
+    allowed_extensions: Optional[set[str]],
+    relay_progress: bool,
+) -> List[EvidenceMatch]:
+    """Scan one UFDR in a pool worker and return its matches to the parent."""
+
+    events = _worker_events
+    emit: ProgressCallback = events.put if relay_progress and events is not None else _ignore_event
+    collected: List[EvidenceMatch] = []
+    try:
+        _scan_ufdr(
+            path,
+            _worker_regex_engine(config_path),
+            allowed_extensions=allowed_extensions,
+            emit=emit,
+            on_matches=lambda _path, matches: collected.extend(matches),
+        )
+    except Exception as exc:
+        raise PartialScanError(f"{type(exc).__name__}: {exc}", collected) from exc
+    return collected
+
+
+def _ignore_event(event: Dict[str, object]) -> None:
+    pass
+
+
 def _run_regex(regex_engine: RegexEngine, payload: EvidencePayload) -> List[EvidenceMatch]:
     if payload.payload_type == "database_row":
-        rows: Iterable[Dict[str, str]] = [dict(payload.content)]  # shallow copy to keep Mapping contract
-        matches = regex_engine.scan_table(rows)
+        # scan_table only reads the mapping, so the row is passed through without a copy.
+        matches = regex_engine.scan_table((payload.content,))
     else:
-        matches = regex_engine.scan_text(str(payload.content))
-    return [build_evidence_match(payload, match) for match in matches]
+        content = payload.content
+        matches = regex_engine.scan_text(content if type(content) is str else str(content))
+    return build_evidence_matches(payload, matches)
@@ -1,10 +1,10 @@
 """Core data models for Prometheus forensic results (F5/F6)."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Dict, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceMatch:
     """Normalized representation of a consolidated match."""
 
@@ -17,5 +17,18 @@ class EvidenceMatch:
     timestamp: Optional[str] = None
 
     def to_dict(self) -> Dict[str, str]:
-        payload = asdict(self)
-        return {key: value for key, value in payload.items() if value is not None}
+        # Built by hand: ``asdict`` deep-copies every field and runs once per
+        # match in the reporter, which dominates serialization on large scans.
+        payload = {
+            "source_file": self.source_file,
+            "internal_path": self.internal_path,
+            "pattern_type": self.pattern_type,
+            "match_value": self.match_value,
+        }
+        if self.file_type is not None:
+            payload["file_type"] = self.file_type
+        if self.context is not None:
+            payload["context"] = self.context
+        if self.timestamp is not None:
+            payload["timestamp"] = self.timestamp
+        return payload
@@ -19,6 +19,18 @@ _FLAG_TABLE: Mapping[str, int] = {
     "unicode": re.UNICODE,
 }
 
+# Flags expressible as scoped inline groups in the combined prefilter; UNICODE is
+# already the default for str patterns.
+_SCOPED_FLAGS: Mapping[int, str] = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+
+# Group references would point at the wrong group once patterns are combined.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
 
 @dataclass(frozen=True)
 class RegexPattern:
@@ -61,6 +73,7 @@ class RegexEngine:
         if not patterns:
             raise ValueError("RegexEngine requires at least one pattern")
         self._patterns = list(patterns)
+        self._prefilter = _compile_prefilter(self._patterns)
 
     @property
     def patterns(self) -> Sequence[RegexPattern]:
@@ -81,6 +94,9 @@ class RegexEngine:
         return cls(patterns)
 
     def scan_text(self, text: str, *, context_window: int = 40) -> List[RegexMatch]:
+        return self._scan(text, context_window, None)
+
+    def _scan(self, text: str, context_window: int, location: Optional[str]) -> List[RegexMatch]:
         matches: List[RegexMatch] = []
         for pattern in self._patterns:
             for match in pattern.finditer(text):
@@ -93,6 +109,7 @@ class RegexEngine:
                         start=start,
                         end=end,
                         context=context,
+                        location=location,
                     )
                 )
         return matches
@@ -105,6 +122,10 @@ class RegexEngine:
         context_window: int = 40,
     ) -> List[RegexMatch]:
         matches: List[RegexMatch] = []
+        # Most cells match nothing: one combined search rules them out before every
+        # pattern runs separately. scan_text does not use it, since on long texts the
+        # alternation costs more than it saves once any match exists.
+        prefilter = self._prefilter.search if self._prefilter is not None else None
         for row_index, row in enumerate(rows):
             iterable = (
                 ((column, row.get(column, "")) for column in columns)
@@ -112,14 +133,31 @@ class RegexEngine:
                 else row.items()
             )
             for column_name, value in iterable:
-                if not isinstance(value, str):
+                if not isinstance(value, str) or (prefilter is not None and prefilter(value) is None):
                     continue
-                for match in self.scan_text(value, context_window=context_window):
-                    location = f"row={row_index};column={column_name}"
-                    matches.append(match.with_location(location))
+                matches.extend(self._scan(value, context_window, f"row={row_index};column={column_name}"))
         return matches
 
 
+def _compile_prefilter(patterns: Sequence[RegexPattern]) -> Optional[re.Pattern[str]]:
+    """Return one alternation matching wherever any pattern matches, if it can be built."""
+
+    if len(patterns) < 2:
+        return None
+    alternatives: List[str] = []
+    for pattern in patterns:
+        flags = pattern.flags & ~re.UNICODE
+        scoped = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+        if flags & ~sum(_SCOPED_FLAGS) or _GROUP_REFERENCE.search(pattern.expression):
+            return None
+        alternatives.append(f"(?{scoped}:{pattern.expression})" if scoped else f"(?:{pattern.expression})")
+    try:
+        return re.compile("|".join(alternatives))
+    except re.error:
+        logger.debug("Could not combine regex patterns into a prefilter")
+        return None
+
+
 def _extract_context(text: str, start: int, end: int, window: int) -> str:
     left = max(start - window, 0)
     right = min(end + window, len(text))
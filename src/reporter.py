@@ -6,15 +6,31 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import IO, Any, Iterable, List, Optional, Sequence
 
 from src.models import EvidenceMatch
 
 logger = logging.getLogger(__name__)
 
+CSV_FIELDNAMES: Sequence[str] = (
+    "source_file",
+    "internal_path",
+    "pattern_type",
+    "match_value",
+    "file_type",
+    "context",
+    "timestamp",
+)
+
 
 class ResultReporter:
-    """Collects matches and writes them to consolidated files."""
+    """Collects matches and writes them to consolidated files.
+
+    By default matches are buffered until :meth:`write`. After :meth:`open`
+    every added match is written straight to temporary JSON/CSV files next to
+    the outputs, so memory stays constant regardless of the number of matches;
+    :meth:`write` (or :meth:`close`) then moves them into place.
+    """
 
     def __init__(
         self,
@@ -29,6 +45,13 @@ class ResultReporter:
             else self._output_path.with_suffix(".csv")
         )
         self._matches: List[EvidenceMatch] = []
+        self._written = 0
+        self._entries = 0
+        # Set by open(); a closed stream must not be overwritten by a later write().
+        self._streaming = False
+        self._json_file: Optional[IO[str]] = None
+        self._csv_file: Optional[IO[str]] = None
+        self._csv_writer: Any = None
 
     @property
     def output_path(self) -> Path:
@@ -40,60 +63,124 @@ class ResultReporter:
 
     @property
     def match_count(self) -> int:
-        return len(self._matches)
+        return self._written + len(self._matches)
+
+    @property
+    def is_open(self) -> bool:
+        return self._json_file is not None
 
     def add_match(self, match: EvidenceMatch) -> None:
-        self._matches.append(match)
+        if self._json_file is not None:
+            self.write_match(match)
+        else:
+            self._matches.append(match)
 
     def extend_matches(self, matches: Iterable[EvidenceMatch]) -> None:
-        self._matches.extend(matches)
+        if self._json_file is not None:
+            for match in matches:
+                self.write_match(match)
+        else:
+            self._matches.extend(matches)
 
     def clear(self) -> None:
-        self._matches.clear()
+        """Forget buffered and streamed matches so the reporter can be reused."""
 
-    def write(self) -> dict[str, Path]:
-        """Write all collected matches to disk in JSON and CSV format."""
-
-        self._output_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path = self._write_json()
-        csv_path = self._write_csv()
+        if self._json_file is not None:
+            raise RuntimeError("ResultReporter is open; close() or discard() it first")
+        self._matches.clear()
+        self._written = 0
+        self._streaming = False
+
+    def open(self) -> None:
+        """Start streaming matches to temporary files beside the outputs."""
+
+        if self._json_file is not None:
+            return
+        if self._streaming:
+            raise RuntimeError("ResultReporter already streamed its outputs; call clear() first")
+        self._open_streams()
+        self._streaming = True
+        pending, self._matches = self._matches, []
+        for match in pending:
+            self.write_match(match)
+
+    def write_match(self, match: EvidenceMatch) -> None:
+        """Append one match to the open JSON and CSV streams."""
+
+        if self._json_file is None:
+            raise RuntimeError("ResultReporter.open() must be called before write_match()")
+        self._write_entry(match)
+        self._written += 1
+
+    def close(self) -> dict[str, Path]:
+        """Finish the open streams and move them over the final outputs."""
+
+        if self._json_file is None or self._csv_file is None:
+            raise RuntimeError("ResultReporter is not open")
+        self._json_file.write("\n]" if self._entries else "]")
+        json_tmp, csv_tmp = self._release()
+        os.replace(json_tmp, self._output_path)
+        os.replace(csv_tmp, self._csv_output_path)
         logger.info(
             "Wrote %d consolidated match(es) to %s and %s",
-            len(self._matches),
-            json_path,
-            csv_path,
+            self.match_count,
+            self._output_path,
+            self._csv_output_path,
         )
-        return {"json": json_path, "csv": csv_path}
+        return {"json": self._output_path, "csv": self._csv_output_path}
 
-    def _write_json(self) -> Path:
-        data = [match.to_dict() for match in self._matches]
+    def discard(self) -> None:
+        """Abort an open stream, removing its temporary files."""
 
-        with tempfile.NamedTemporaryFile("w", delete=False, dir=str(self._output_path.parent), encoding="utf-8") as tmp:
-            json.dump(data, tmp, ensure_ascii=False, indent=2)
-            tmp_path = Path(tmp.name)
+        if self._json_file is None:
+            return
+        for tmp_path in self._release():
+            tmp_path.unlink(missing_ok=True)
+        self._written = 0
+        self._streaming = False
 
-        os.replace(tmp_path, self._output_path)
-        return self._output_path
+    def write(self) -> dict[str, Path]:
+        """Write all collected matches to disk in JSON and CSV format.
 
-    def _write_csv(self) -> Path:
-        fieldnames: Sequence[str] = [
-            "source_file",
-            "internal_path",
-            "pattern_type",
-            "match_value",
-            "file_type",
-            "context",
-            "timestamp",
-        ]
+        While streaming this closes the open files. Once a stream has been
+        closed, the outputs are final: write() raises until clear() is called.
+        """
 
-        self._csv_output_path.parent.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile("w", delete=False, dir=str(self._csv_output_path.parent), encoding="utf-8", newline="") as tmp:
-            writer = csv.DictWriter(tmp, fieldnames=fieldnames)
-            writer.writeheader()
+        if self._json_file is None:
+            if self._streaming:
+                raise RuntimeError("ResultReporter already streamed its outputs; call clear() first")
+            # Buffered mode: the collected matches are kept so write() can be repeated.
+            self._open_streams()
             for match in self._matches:
-                row = {key: getattr(match, key) for key in fieldnames}
-                writer.writerow(row)
-            tmp_path = Path(tmp.name)
+                self._write_entry(match)
+        return self.close()
 
-        os.replace(tmp_path, self._csv_output_path)
-        return self._csv_output_path
+    def _open_streams(self) -> None:
+        self._output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._csv_output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._json_file = tempfile.NamedTemporaryFile(
+            "w", delete=False, dir=str(self._output_path.parent), encoding="utf-8"
+        )
+        self._csv_file = tempfile.NamedTemporaryFile(
+            "w", delete=False, dir=str(self._csv_output_path.parent), encoding="utf-8", newline=""
+        )
+        self._json_file.write("[")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES)
+        self._csv_writer.writeheader()
+        self._entries = 0
+
+    def _write_entry(self, match: EvidenceMatch) -> None:
+        assert self._json_file is not None
+        # Same layout as json.dump(..., indent=2) over the whole list.
+        entry = json.dumps(match.to_dict(), ensure_ascii=False, indent=2).replace("\n", "\n  ")
+        self._json_file.write(("\n  " if self._entries == 0 else ",\n  ") + entry)
+        self._csv_writer.writerow({key: getattr(match, key) for key in CSV_FIELDNAMES})
+        self._entries += 1
+
+    def _release(self) -> tuple[Path, Path]:
+        assert self._json_file is not None and self._csv_file is not None
+        self._json_file.close()
+        self._csv_file.close()
+        paths = (Path(self._json_file.name), Path(self._csv_file.name))
+        self._json_file = self._csv_file = self._csv_writer = None
+        return paths
@@ -210,8 +210,8 @@ def main() -> None:
             total_files_all = 0
             for ufdr_path in ufdr_paths:
                 try:
-                    navigator = UFDRContentNavigator(ufdr_path, allowed_extensions=allowed_extensions_set)
-                    plan = navigator.plan_processing()
+                    with UFDRContentNavigator(ufdr_path, allowed_extensions=allowed_extensions_set) as navigator:
+                        plan = navigator.plan_processing()
                     total_files_all += len(plan.textual_members)
                 except Exception as e:
                     logger.warning("Erro ao contar arquivos em %s: %s", ufdr_path, e)
@@ -423,6 +423,7 @@ def main() -> None:
                 output_path=DEFAULT_OUTPUT_BASE,
                 progress_callback=handle_progress,
                 allowed_extensions=allowed_extensions_set,
+                ufdr_paths=ufdr_paths,
             )
 
             logger.info("")
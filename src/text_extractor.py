@@ -26,14 +26,37 @@ class TextExtractionResult:
     engine: str
 
 
+# Suffix -> TextExtractor method name; looked up by name so patched methods are honoured.
+_ENGINE_BY_SUFFIX: dict[str, str] = {
+    ".pdf": "_extract_pdf",
+    ".docx": "_extract_docx",
+    ".doc": "_extract_doc",
+    ".pptx": "_extract_pptx",
+    ".xlsx": "_extract_xlsx",
+    ".xls": "_extract_xlsx",
+    ".xml": "_extract_xml_html",
+    ".html": "_extract_xml_html",
+    ".htm": "_extract_xml_html",
+    ".eml": "_extract_eml",
+    ".msg": "_extract_msg",
+    ".json": "_extract_json",
+    ".csv": "_extract_csv",
+    ".tsv": "_extract_csv",
+}
+
+
 class TextExtractor:
     """Extract textual content from various file formats using specialized libraries."""
 
     def __init__(self) -> None:
+        # Optional engines are imported on first use; False means the import failed
+        # and later files skip the (slow) failing import entirely.
         self._pdfminer_available = None
         self._docx_available = None
+        self._doc_available = None
         self._pptx_available = None
         self._xlsx_available = None
+        self._xls_available = None
         self._beautifulsoup_available = None
         self._msg_available = None
 
@@ -41,37 +64,10 @@ class TextExtractor:
         """Return extracted text from the provided binary stream."""
 
         suffix = Path(source_name).suffix.lower() or ".bin"
+        # Unknown suffixes fall back to plain text.
+        engine_method = getattr(self, _ENGINE_BY_SUFFIX.get(suffix, "_extract_plain_text"))
         with self._materialize_stream(stream, suffix=suffix) as temp_path:
-            engine = None
-            text = ""
-
-            # Route to appropriate extractor based on file type
-            if suffix == ".pdf":
-                text, engine = self._extract_pdf(temp_path)
-            elif suffix in {".docx"}:
-                text, engine = self._extract_docx(temp_path)
-            elif suffix in {".doc"}:
-                text, engine = self._extract_doc(temp_path)
-            elif suffix in {".pptx"}:
-                text, engine = self._extract_pptx(temp_path)
-            elif suffix in {".xlsx", ".xls"}:
-                text, engine = self._extract_xlsx(temp_path)
-            elif suffix in {".xml", ".html", ".htm"}:
-                text, engine = self._extract_xml_html(temp_path)
-            elif suffix in {".eml"}:
-                text, engine = self._extract_eml(temp_path)
-            elif suffix in {".msg"}:
-                text, engine = self._extract_msg(temp_path)
-            elif suffix in {".json"}:
-                text, engine = self._extract_json(temp_path)
-            elif suffix in {".csv", ".tsv"}:
-                text, engine = self._extract_csv(temp_path, suffix)
-            elif suffix in {".txt", ".md", ".log", ".vcf", ".ics", ".rtf"}:
-                text, engine = self._extract_plain_text(temp_path)
-            else:
-                # Try plain text as fallback
-                text, engine = self._extract_plain_text(temp_path)
-
+            text, engine = engine_method(temp_path)
             return TextExtractionResult(text=text or "", engine=engine or "unknown")
 
     @contextmanager
@@ -100,6 +96,8 @@ class TextExtractor:
 
     def _extract_docx(self, path: Path) -> tuple[str, str]:
         """Extract text from DOCX files."""
+        if self._docx_available is False:
+            return ("", "docx-unavailable")
         try:
             import docx  # type: ignore[import]
         except ImportError:
@@ -117,9 +115,12 @@ class TextExtractor:
 
     def _extract_doc(self, path: Path) -> tuple[str, str]:
         """Extract text from DOC files (legacy Word format)."""
+        if self._doc_available is False:
+            return ("", "doc-unavailable")
         try:
             import docx2txt  # type: ignore[import]
         except ImportError:
+            self._doc_available = False
             logger.debug("docx2txt não disponível para %s", path.name)
             return ("", "doc-unavailable")
         
@@ -132,6 +133,8 @@ class TextExtractor:
 
     def _extract_pptx(self, path: Path) -> tuple[str, str]:
         """Extract text from PPTX files."""
+        if self._pptx_available is False:
+            return ("", "pptx-unavailable")
         try:
             from pptx import Presentation  # type: ignore[import]
         except ImportError:
@@ -154,6 +157,8 @@ class TextExtractor:
     def _extract_xlsx(self, path: Path) -> tuple[str, str]:
         """Extract text from XLSX/XLS files."""
         suffix = path.suffix.lower()
+        if (self._xlsx_available if suffix == ".xlsx" else self._xls_available) is False:
+            return ("", "xlsx-unavailable")
         try:
             if suffix == ".xlsx":
                 import openpyxl  # type: ignore[import]
@@ -177,6 +182,10 @@ class TextExtractor:
                             texts.append(row_text)
                 return ("\n".join(texts), "xlrd")
         except ImportError:
+            if suffix == ".xlsx":
+                self._xlsx_available = False
+            else:
+                self._xls_available = False
             logger.debug("openpyxl/xlrd não disponível para %s", path.name)
             return ("", "xlsx-unavailable")
         except Exception as exc:
@@ -185,6 +194,8 @@ class TextExtractor:
 
     def _extract_xml_html(self, path: Path) -> tuple[str, str]:
         """Extract text from XML/HTML files."""
+        if self._beautifulsoup_available is False:
+            return self._extract_plain_text(path)
         try:
             from bs4 import BeautifulSoup  # type: ignore[import]
         except ImportError:
@@ -236,6 +247,8 @@ class TextExtractor:
 
     def _extract_msg(self, path: Path) -> tuple[str, str]:
         """Extract text from MSG email files."""
+        if self._msg_available is False:
+            return ("", "msg-unavailable")
         try:
             import extract_msg  # type: ignore[import]
         except ImportError:
@@ -267,10 +280,10 @@ class TextExtractor:
             logger.warning("json falhou para %s: %s", path.name, exc)
             return ("", "json-error")
 
-    def _extract_csv(self, path: Path, suffix: str) -> tuple[str, str]:
+    def _extract_csv(self, path: Path) -> tuple[str, str]:
         """Extract text from CSV/TSV files."""
         try:
-            delimiter = "\t" if suffix == ".tsv" else ","
+            delimiter = "\t" if path.suffix.lower() == ".tsv" else ","
             with path.open("r", encoding="utf-8", errors="ignore") as f:
                 reader = csv.reader(f, delimiter=delimiter)
                 rows = []
@@ -313,8 +326,8 @@ class TextExtractor:
         try:
             text = extract_text(str(path))
         except Exception as exc:  # pragma: no cover - defensivo
+            # A single malformed PDF must not disable pdfminer for the remaining files.
             logger.warning("pdfminer falhou para %s: %s", path, exc)
-            self._pdfminer_available = False
             return ""
 
         self._pdfminer_available = True
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 import re
+from zipfile import ZipFile
 
 import pytest
 import typer
@@ -73,3 +74,31 @@ def test_scan_command_errors_when_config_missing(tmp_path: Path) -> None:
     assert result.exit_code != 0
     error_text = strip_ansi(result.stderr)
     assert "Arquivo de configuração não encontrado" in error_text
+
+
+def test_scan_command_without_progress_writes_results(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    with ZipFile(input_dir / "case.ufdr", "w") as archive:
+        archive.writestr("notes/report.txt", "teste de varredura")
+
+    config_path = tmp_path / "patterns.json"
+    config_path.write_text('{"dummy": "teste"}', encoding="utf-8")
+
+    result = runner.invoke(
+        cli.app,
+        [
+            "scan",
+            "--input",
+            str(input_dir),
+            "--config",
+            str(config_path),
+            "--output",
+            str(tmp_path / "out" / "results.json"),
+            "--no-progress",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Ocorrências encontradas: 1" in strip_ansi(result.stderr)
+    assert len(list((tmp_path / "out").glob("results_*.json"))) == 1
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import io
 import sqlite3
+import sys
 from pathlib import Path
 from zipfile import ZipFile
 
 import pytest
 
+from src import content_navigator
 from src.content_navigator import UFDRContentNavigator, TextExtractor
 from src.database_reader import UFDRDatabaseReader
 from src.text_extractor import TextExtractionResult
-from src.extractor import UFDRExtractor
+from src.extractor import UFDRExtractor, UFDRMember
 
 
 def _build_sqlite_file(db_path: Path) -> None:
@@ -68,6 +70,52 @@ def test_database_reader_returns_rows(tmp_path: Path) -> None:
     assert first_row.values["body"] == "primeira mensagem"
 
 
+def test_database_reader_batches_keep_every_row(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    archive_path = _create_ufdr_with_database(tmp_path)
+    monkeypatch.setattr("src.database_reader.FETCH_BATCH_SIZE", 1)
+
+    reader = UFDRDatabaseReader(UFDRExtractor(archive_path))
+    rows = list(reader.iter_rows(next(reader.list_databases())))
+
+    assert [row.row_index for row in rows] == [0, 1]
+    assert [row.values for row in rows] == [
+        {"id": "1", "body": "primeira mensagem"},
+        {"id": "2", "body": "segunda mensagem"},
+    ]
+
+
+def test_database_reader_reads_wal_database_in_memory(tmp_path: Path) -> None:
+    db_file = tmp_path / "wal.db"
+    connection = sqlite3.connect(db_file)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE notes (body TEXT)")
+    connection.execute("INSERT INTO notes (body) VALUES ('nota em wal')")
+    connection.commit()
+    connection.close()
+
+    archive_path = tmp_path / "archive.ufdr"
+    with ZipFile(archive_path, "w") as archive:
+        archive.write(db_file, arcname="data/wal.db")
+
+    reader = UFDRDatabaseReader(UFDRExtractor(archive_path))
+    rows = list(reader.iter_rows(next(reader.list_databases())))
+
+    assert [row.values["body"] for row in rows] == ["nota em wal"]
+
+
+def test_database_reader_falls_back_to_temp_file_for_large_databases(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    archive_path = _create_ufdr_with_database(tmp_path)
+    monkeypatch.setattr("src.database_reader.DESERIALIZE_MAX_BYTES", 0)
+
+    reader = UFDRDatabaseReader(UFDRExtractor(archive_path))
+    rows = list(reader.iter_rows(next(reader.list_databases())))
+
+    assert len(rows) == 2
+    assert rows[0].values["body"] == "primeira mensagem"
+
+
 def test_content_navigator_prioritizes_databases(tmp_path: Path) -> None:
     archive_path = _create_ufdr_with_database(tmp_path)
     navigator = UFDRContentNavigator(archive_path)
@@ -79,6 +127,20 @@ def test_content_navigator_prioritizes_databases(tmp_path: Path) -> None:
     assert payloads[0].file_type == "database"
 
 
+def test_content_navigator_plan_filters_by_allowed_extensions(tmp_path: Path) -> None:
+    archive_path = tmp_path / "archive.ufdr"
+    with ZipFile(archive_path, "w") as archive:
+        archive.writestr("docs/notes.txt", "texto")
+        archive.writestr("docs/page.html", "<p>texto</p>")
+        archive.writestr("bin/blob.bin", "dados")
+
+    with UFDRContentNavigator(archive_path, allowed_extensions={".txt"}) as navigator:
+        plan = navigator.plan_processing()
+        assert [member.name for member in plan.textual_members] == ["docs/notes.txt"]
+        assert plan.database_members == []
+        assert len(plan.members) == 3
+
+
 def test_content_navigator_includes_text_even_with_databases(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     archive_path = _create_ufdr_with_database_and_text(tmp_path, "docs/report.pdf", "conteúdo pdf fictício")
 
@@ -90,6 +152,7 @@ def test_content_navigator_includes_text_even_with_databases(monkeypatch: pytest
             return TextExtractionResult(text="texto do pdf", engine="dummy")
 
     monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
 
     navigator = UFDRContentNavigator(archive_path)
     payloads = list(navigator.collect_payloads())
@@ -113,6 +176,7 @@ def test_content_navigator_fallback_to_text(monkeypatch: pytest.MonkeyPatch, tmp
             return TextExtractionResult(text="conteúdo extraído", engine="dummy")
 
     monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
 
     navigator = UFDRContentNavigator(archive_path)
     payloads = list(navigator.collect_payloads())
@@ -124,6 +188,94 @@ def test_content_navigator_fallback_to_text(monkeypatch: pytest.MonkeyPatch, tmp
     assert payload.file_type == "text"
 
 
+def test_content_navigator_skips_empty_members(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    archive_path = _create_ufdr_with_text(tmp_path, "logs/empty.log", "")
+    extracted: list[str] = []
+
+    class DummyTextExtractor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def extract(self, stream, *, source_name: str):
+            extracted.append(source_name)
+            return TextExtractionResult(text="nunca", engine="dummy")
+
+    monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
+
+    navigator = UFDRContentNavigator(archive_path)
+    stages = []
+    payloads = list(navigator.collect_payloads(progress_callback=lambda event: stages.append(event.stage)))
+
+    assert payloads == []
+    assert extracted == []
+    assert stages == ["start", "skip"]
+
+
+def test_content_navigator_parallel_extraction_keeps_member_order(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    archive_path = tmp_path / "archive.ufdr"
+    names = [f"docs/note{index:02d}.txt" for index in range(12)]
+    with ZipFile(archive_path, "w") as archive:
+        for name in names:
+            archive.writestr(name, name)
+
+    class DummyTextExtractor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def extract(self, stream, *, source_name: str):
+            return TextExtractionResult(text=stream.read().decode("utf-8"), engine="dummy")
+
+    monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
+
+    navigator = UFDRContentNavigator(archive_path, max_workers=4)
+    payloads = list(navigator.collect_payloads())
+
+    assert [payload.internal_path for payload in payloads] == names
+    assert [payload.content for payload in payloads] == names
+
+
+def test_content_navigator_process_workers_extract_text(tmp_path: Path) -> None:
+    archive_path = tmp_path / "archive.ufdr"
+    names = [f"docs/note{index:02d}.txt" for index in range(6)]
+    with ZipFile(archive_path, "w") as archive:
+        for name in names:
+            archive.writestr(name, f"conteudo {name}")
+
+    pools = []
+    for _ in range(2):
+        navigator = UFDRContentNavigator(archive_path, max_workers=2, worker_mode="process")
+        payloads = list(navigator.collect_payloads())
+        pools.append(content_navigator._process_pool)
+
+        assert [payload.internal_path for payload in payloads] == names
+        assert [payload.content for payload in payloads] == [f"conteudo {name}" for name in names]
+
+    # Both navigators ran on the same shared pool.
+    assert pools[0] is pools[1] is not None
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("docs/Report.PDF", "document"),
+        ("docs/budget.ods", "spreadsheet"),
+        ("mail/inbox.eml", "email"),
+        ("agenda/event.ics", "calendar"),
+        ("contacts/card.vcf", "contact"),
+        ("media/photo.jpeg", "image"),
+        ("logs/app.log", "text"),
+        ("bin/blob.dat", "binary"),
+        ("folder.d/no_suffix", "binary"),
+    ],
+)
+def test_guess_file_type_uses_suffix_table(name: str, expected: str) -> None:
+    member = UFDRMember(name=name, size=1, compressed_size=1, is_dir=False, modified=None)
+
+    assert UFDRContentNavigator._guess_file_type(member) == expected
+
+
 def test_text_extractor_extracts_plain_text(monkeypatch: pytest.MonkeyPatch) -> None:
     extractor = TextExtractor()
 
@@ -158,3 +310,29 @@ def test_text_extractor_returns_empty_when_pdf_empty(monkeypatch: pytest.MonkeyP
     assert result.engine == "pdfminer"
     assert result.text == ""
     assert result.text == ""
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("texto", "texto"),
+        (None, ""),
+        (42, "42"),
+        (1.5, "1.5"),
+        ("ação".encode("utf-8"), "ação"),
+        ("ação".encode("latin-1"), "ação"),
+    ],
+)
+def test_normalize_value_handles_sqlite_types(value: object, expected: str) -> None:
+    assert UFDRDatabaseReader._normalize_value(value) == expected
+
+
+def test_text_extractor_does_not_retry_missing_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    extractor = TextExtractor()
+    monkeypatch.setitem(sys.modules, "docx2txt", None)
+
+    first = extractor.extract(io.BytesIO(b"legacy"), source_name="old.doc")
+    monkeypatch.delitem(sys.modules, "docx2txt")
+    second = extractor.extract(io.BytesIO(b"legacy"), source_name="old.doc")
+
+    assert first.engine == second.engine == "doc-unavailable"
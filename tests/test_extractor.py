@@ -1,11 +1,11 @@
 """Unit tests for UFDRExtractor (F2)."""
 
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile
 
 import pytest
 
-from src.extractor import UFDRExtractor, list_ufdr_members
+from src.extractor import UFDRExtractor, list_ufdr_members, member_suffix
 
 
 def create_sample_ufdr(tmp_path: Path) -> Path:
@@ -24,6 +24,75 @@ def test_list_members_returns_metadata(tmp_path: Path) -> None:
     names = {member.name for member in members}
     assert names == {"data/messages.db", "reports/report.html"}
     assert all(member.size > 0 for member in members)
+    assert {member.suffix for member in members} == {".db", ".html"}
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("docs/Report.PDF", ".pdf"), ("archive.tar.gz", ".gz"), ("folder.d/README", ""), (".bashrc", ""), ("trailing.", "")],
+)
+def test_member_suffix_matches_path_suffix(name: str, expected: str) -> None:
+    assert member_suffix(name) == expected == Path(name).suffix.lower()
+
+
+def test_iter_members_filtered_skips_rejected_names(tmp_path: Path) -> None:
+    archive_path = create_sample_ufdr(tmp_path)
+
+    with UFDRExtractor(archive_path) as extractor:
+        members = list(extractor.iter_members_filtered(lambda name: name.endswith(".db")))
+
+    assert [member.name for member in members] == ["data/messages.db"]
+
+
+def test_iter_members_fast_matches_zipfile_listing(tmp_path: Path) -> None:
+    archive_path = tmp_path / "sample.ufdr"
+    with ZipFile(archive_path, "w") as archive:
+        archive.writestr("data/messages.db", "binary content")
+        archive.writestr("fotos/", "")
+        archive.writestr("relatórios/ação.txt", "conteúdo")
+        archive.comment = b"caso 42"
+
+    extractor = UFDRExtractor(archive_path)
+
+    assert list(extractor.iter_members_fast()) == list(extractor.iter_members())
+    assert [member.name for member in extractor.iter_members_fast(lambda name: name.endswith(".txt"))] == [
+        "relatórios/ação.txt"
+    ]
+
+
+def test_iter_members_fast_truncates_names_at_null_byte(tmp_path: Path) -> None:
+    archive_path = tmp_path / "sample.ufdr"
+    with ZipFile(archive_path, "w") as archive:
+        archive.writestr("docs/nota.txtZ.exe", "conteúdo")
+    archive_path.write_bytes(archive_path.read_bytes().replace(b"nota.txtZ.exe", b"nota.txt\0.exe"))
+
+    extractor = UFDRExtractor(archive_path)
+
+    assert [member.name for member in extractor.iter_members_fast()] == ["docs/nota.txt"]
+    assert list(extractor.iter_members_fast()) == list(extractor.iter_members())
+
+
+def test_iter_members_fast_lists_every_member_of_zip64_archive(tmp_path: Path) -> None:
+    archive_path = tmp_path / "large.ufdr"
+    # 65,535+ entries force a ZIP64 end record; a 30-byte first name makes its
+    # first central header exactly as long as the ZIP64 record and locator.
+    names = ["a" * 26 + ".txt"] + [f"f/{index}.txt" for index in range(1, 70_001)]
+    with ZipFile(archive_path, "w") as archive:
+        for name in names:
+            archive.writestr(name, "")
+
+    extractor = UFDRExtractor(archive_path)
+
+    assert [member.name for member in extractor.iter_members_fast()] == names
+    assert len(list_ufdr_members(archive_path)) == len(names)
+
+
+def test_iter_members_fast_falls_back_for_invalid_archive(tmp_path: Path) -> None:
+    archive_path = tmp_path / "broken.ufdr"
+    archive_path.write_bytes(b"not a zip file")
+
+    with pytest.raises(BadZipFile):
+        list(UFDRExtractor(archive_path).iter_members_fast())
 
 
 def test_extract_selected(tmp_path: Path) -> None:
@@ -37,6 +106,19 @@ def test_extract_selected(tmp_path: Path) -> None:
     assert extracted[0].exists()
 
 
+def test_extractor_reuses_archive_handle_until_closed(tmp_path: Path) -> None:
+    archive_path = create_sample_ufdr(tmp_path)
+
+    with UFDRExtractor(archive_path) as extractor:
+        list(extractor.iter_members())
+        archive = extractor._archive
+        with extractor.open_member("reports/report.html") as handle:
+            assert handle.read() == b"<html></html>"
+        assert extractor._archive is archive is not None
+
+    assert extractor._archive is None
+
+
 def test_missing_source(tmp_path: Path) -> None:
     extractor = UFDRExtractor(tmp_path / "missing.ufdr")
     with pytest.raises(FileNotFoundError):
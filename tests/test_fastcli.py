@@ -0,0 +1,33 @@
+"""Smoke tests for the lightweight argparse entry point (F7)."""
+
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from src import fastcli
+
+
+def test_fastcli_runs_pipeline(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    with ZipFile(input_dir / "case.ufdr", "w") as archive:
+        archive.writestr("notes/report.txt", "teste de varredura")
+
+    config_path = tmp_path / "patterns.json"
+    config_path.write_text('{"dummy": "teste"}', encoding="utf-8")
+
+    exit_code = fastcli.main(
+        ["-i", str(input_dir), "-c", str(config_path), "-o", str(tmp_path / "out" / "results.json")]
+    )
+
+    assert exit_code == 0
+    assert "Ocorrências encontradas: 1" in capsys.readouterr().err
+    assert len(list((tmp_path / "out").glob("results_*.json"))) == 1
+
+
+def test_fastcli_rejects_missing_config(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        fastcli.main(["-i", str(tmp_path), "-c", str(tmp_path / "missing.json")])
+
+    assert excinfo.value.code == 2
@@ -1,10 +1,10 @@
 """Tests for forensic metadata utilities (F6)."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from src.content_navigator import EvidencePayload
-from src.forensics import build_evidence_match
+from src.forensics import _format_timestamp, build_evidence_match, build_evidence_matches
 from src.models import EvidenceMatch
 from src.regex_engine import RegexPattern, RegexMatch
 
@@ -57,3 +57,36 @@ def test_build_match_for_text_payload_without_timestamp() -> None:
     assert evidence.file_type == "document"
     assert evidence.context == "CPF encontrado"
     assert evidence.timestamp is None
+
+
+def test_build_matches_shares_payload_fields() -> None:
+    payload = EvidencePayload(
+        source_file=Path("/evidence/case.ufdr"),
+        internal_path="data/messages.db",
+        payload_type="database_row",
+        file_type="database",
+        content={"col": "value"},
+        metadata={"table": "contacts", "row_index": 3},
+        modified=datetime(2025, 11, 3, 18, 12, 55),
+    )
+    regex_matches = [
+        _make_regex_match("a@example.com", context="primeiro", location="column=email"),
+        _make_regex_match("b@example.com", context="segundo"),
+    ]
+
+    evidences = build_evidence_matches(payload, regex_matches)
+
+    assert [evidence.match_value for evidence in evidences] == ["a@example.com", "b@example.com"]
+    assert [evidence.context for evidence in evidences] == [
+        "tabela contacts | linha 3 | column=email | primeiro",
+        "tabela contacts | linha 3 | segundo",
+    ]
+    assert {evidence.source_file for evidence in evidences} == {"case.ufdr"}
+    assert {evidence.timestamp for evidence in evidences} == {"2025-11-03T18:12:55Z"}
+
+
+def test_format_timestamp_converts_aware_values_to_utc() -> None:
+    brasilia = timezone(timedelta(hours=-3))
+
+    assert _format_timestamp(datetime(2025, 11, 3, 15, 12, 55, tzinfo=brasilia)) == "2025-11-03T18:12:55Z"
+    assert _format_timestamp(datetime(2025, 11, 3, 18, 12, 55, 250000)) == "2025-11-03T18:12:55.250000Z"
@@ -1,14 +1,20 @@
 """Smoke tests for the PyQt6 GUI scaffold (F8)."""
 
+import json
 import sys
+import threading
+from pathlib import Path
 
 import pytest
 
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QPersistentModelIndex, QThreadPool, Qt
+from PyQt6.QtWidgets import QApplication, QFileDialog, QHeaderView, QStyleOptionViewItem
 
-from src.gui import PrometheusWindow, ResultRow
+from src import gui, main
+from src.gui import PrometheusWindow, ResultRow, ResultsDelegate, ResultsModel
+from src.models import EvidenceMatch
 
 
 def test_window_initializes_and_populates_table() -> None:
@@ -22,8 +28,371 @@ def test_window_initializes_and_populates_table() -> None:
 
     window.populate_results(rows)
 
-    assert window.results_table.rowCount() == len(rows)
-    assert window.results_table.columnCount() == 5
+    assert window.results_model.rowCount() == len(rows)
+    assert window.results_model.columnCount() == 5
+    assert "123.456.789-00" in window.results_model.columns()[2]
+
+    window.results_table.sortByColumn(1, Qt.SortOrder.AscendingOrder)
+    assert window.results_table.model().index(0, 1).data() == "CPF"
+
+    window.filter_results("Email")
+    assert window.results_table.model().rowCount() == 1
+
+    window.close()
+    window.deleteLater()
+
+
+def test_window_appends_results_in_batches() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window.append_results([ResultRow("a.ufdr", "Email", "a@example.com", "x.txt", "")])
+    window.append_results(
+        [
+            ResultRow("b.ufdr", "CPF", "123.456.789-00", "y.txt", ""),
+            ResultRow("c.ufdr", "CPF", "987.654.321-00", "z.txt", ""),
+        ]
+    )
+
+    assert window.results_model.rowCount() == 3
+    assert window.results_table.isSortingEnabled()
+
+    window.close()
+    window.deleteLater()
+
+
+def test_streamed_batches_are_sorted_once_when_the_scan_ends(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window.results_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    sorts = []
+    original_sort = window.results_model.sort
+    monkeypatch.setattr(window.results_model, "sort", lambda *args: (sorts.append(args), original_sort(*args)))
+
+    for name in ("c", "a", "b"):
+        window.append_results([ResultRow(f"{name}.ufdr", "Email", f"{name}@example.com", "x.txt", "")])
+
+    assert sorts == []
+    assert window.results_model.columns()[0] == ["c.ufdr", "a.ufdr", "b.ufdr"]
+
+    window._on_scan_result({"processed": 1, "matches": 3})
+
+    assert sorts == [(0, Qt.SortOrder.AscendingOrder)]
+    assert list(window.results_model.columns()[0]) == ["a.ufdr", "b.ufdr", "c.ufdr"]
+
+    window.close()
+    window.deleteLater()
+
+
+def test_results_model_stores_columns() -> None:
+    model = ResultsModel()
+    model.set_columns([["a.ufdr"], ["Email"], ["a@example.com"], ["x.txt"], ["2025-01-01T12:00:00Z"]])
+
+    assert model.rowCount() == 1
+    assert model.row(0) == ResultRow("a.ufdr", "Email", "a@example.com", "x.txt", "2025-01-01T12:00:00Z")
+    with pytest.raises(ValueError):
+        model.set_columns([["a.ufdr"], []])
+
+
+def test_results_delegate_reads_only_display_text() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window.populate_results([ResultRow("a.ufdr", "Email", "a@example.com", "x.txt", "")])
+    delegate = window.results_table.itemDelegate()
+    assert isinstance(delegate, ResultsDelegate)
+
+    option = QStyleOptionViewItem()
+    delegate.initStyleOption(option, window.results_table.model().index(0, 2))
+    assert option.text == "a@example.com"
+
+    window.close()
+    window.deleteLater()
+
+
+def test_scan_runs_on_thread_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    config_path = tmp_path / "patterns.json"
+    config_path.write_text('{"email": "@"}', encoding="utf-8")
+    output_path = tmp_path / "results_20250101_120000.json"
+    threads = []
+
+    def fake_pipeline(**kwargs):
+        threads.append(threading.current_thread())
+        callback = kwargs["progress_callback"]
+        callback({"type": "ufdr-start", "path": "a.ufdr", "textual_total": 1})
+        callback({"type": "matches", "path": "a.ufdr", "matches": [EvidenceMatch("a.ufdr", "x.txt", "email", "a@b.c")]})
+        return {"processed": 1, "matches": 1, "failures": [], "output": str(output_path), "csv_output": None}
+
+    monkeypatch.setattr(main, "run_pipeline", fake_pipeline)
+
+    window = PrometheusWindow()
+    window.output_path = tmp_path / "results.json"
+    window.input_edit.setText(str(tmp_path))
+    window.config_edit.setText(str(config_path))
+    window._start_scan()
+    assert not window.run_button.isEnabled()
+
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert window.results_model.row(0).match_value == "a@b.c"
+    assert window.run_button.isEnabled()
+    assert window.status_label.text() == "Processados: 1 | Ocorrências: 1 | Falhas: 0"
+
+    window.close()
+    window.deleteLater()
+
+
+def test_populate_results_streams_iterables_in_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    monkeypatch.setattr(gui, "RESULT_BATCH_SIZE", 2)
+
+    window = PrometheusWindow()
+    batches = []
+    original_extend = window.results_model.extend
+    monkeypatch.setattr(window.results_model, "extend", lambda rows: (batches.append(len(rows)), original_extend(rows)))
+    window.populate_results(ResultRow(f"{index}.ufdr", "CPF", str(index), "x.txt", "") for index in range(5))
+
+    assert batches == [2, 2, 1]
+    assert window.results_model.rowCount() == 5
+    assert window.results_table.updatesEnabled()
+
+    window.close()
+    window.deleteLater()
+
+
+def test_results_model_sorts_columns_and_keeps_persistent_indexes() -> None:
+    model = ResultsModel()
+    model.set_rows(
+        [
+            ResultRow("b.ufdr", "Email", "b@example.com", "y.txt", "2025-01-02T00:00:00Z"),
+            ResultRow("a.ufdr", "CPF", "123.456.789-00", "x.txt", "2025-01-01T00:00:00Z"),
+        ]
+    )
+    selected = QPersistentModelIndex(model.index(0, 2))
+
+    model.sort(4, Qt.SortOrder.AscendingOrder)
+
+    assert model.row(0) == ResultRow("a.ufdr", "CPF", "123.456.789-00", "x.txt", "2025-01-01T00:00:00Z")
+    assert selected.row() == 1
+    assert selected.data() == "b@example.com"
+
+
+def test_help_is_rendered_when_tab_is_first_opened() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    assert window.help_view.toPlainText() == ""
+
+    window.tabs.setCurrentIndex(1)
+    assert "Guia Rápido" in window.help_view.toPlainText()
+
+    window.close()
+    window.deleteLater()
+
+
+def test_results_table_uses_fixed_rows_and_interactive_columns() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    header = window.results_table.horizontalHeader()
+
+    assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Interactive
+    assert header.sectionSize(0) == gui.RESULT_COLUMN_WIDTHS[0]
+    assert header.stretchLastSection()
+    assert window.results_table.verticalHeader().sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+
+    window.close()
+    window.deleteLater()
+
+
+def test_typed_paths_replace_cached_dialog_paths(tmp_path: Path) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window._evidence_dir = tmp_path
+    window.input_edit.setText(str(tmp_path / "other"))
+
+    assert window._evidence_dir is None
+
+    window.close()
+    window.deleteLater()
+
+
+def test_path_fields_have_filesystem_completers() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+
+    assert window.input_edit.completer() is not None
+    assert window.config_edit.completer().model().nameFilters() == ["*.json"]
+
+    window.close()
+    window.deleteLater()
+
+
+def test_status_banner_returns_to_idle_text() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window._export_results()
+    assert window.status_label.text() == "Não há resultados para exportar no momento."
+    assert window._status_timer.isActive()
+
+    window._status_timer.timeout.emit()
+    assert window.status_label.text() == gui.IDLE_STATUS
+
+    window.close()
+    window.deleteLater()
+
+
+def test_export_worker_streams_rows_to_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gui, "EXPORT_CHUNK_SIZE", 2)
+    model = ResultsModel()
+    rows = [ResultRow(f"{index}.ufdr", "CPF", "123.456.789-00", "ação.txt", "") for index in range(3)]
+    model.set_rows(rows)
+    destination = tmp_path / "export" / "results.json"
+    results = []
+
+    worker = gui.ExportWorker(model.columns(), model.rowCount(), destination)
+    worker.signals.result.connect(results.append)
+    worker.run()
+
+    exported = json.loads(destination.read_text(encoding="utf-8"))
+    assert [ResultRow(**entry) for entry in exported] == rows
+    assert results == [{"output": str(destination), "rows": 3}]
+
+
+def test_results_model_finalize_freezes_until_next_append() -> None:
+    model = ResultsModel()
+    model.set_rows([ResultRow("b.ufdr", "Email", "b@example.com", "y.txt", "")])
+
+    model.finalize()
+    assert all(isinstance(column, tuple) for column in model.columns())
+
+    model.extend([ResultRow("a.ufdr", "CPF", "123.456.789-00", "x.txt", "")])
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert model.row(0).source_file == "a.ufdr"
+    assert all(isinstance(column, list) for column in model.columns())
+
+
+def test_populate_results_keeps_header_sort_order() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window.results_table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+    window.populate_results(
+        [
+            ResultRow("a.ufdr", "CPF", "123.456.789-00", "x.txt", ""),
+            ResultRow("b.ufdr", "Email", "b@example.com", "y.txt", ""),
+        ]
+    )
+
+    assert window.results_table.model().index(0, 0).data() == "b.ufdr"
+    assert window.results_table.alternatingRowColors()
+    assert window.results_table.updatesEnabled()
+
+    window.close()
+    window.deleteLater()
+
+
+def test_browse_input_uses_non_native_dialog(tmp_path: Path) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window._browse_input()
+    dialog = window.findChild(QFileDialog)
+
+    assert dialog.testOption(QFileDialog.Option.DontUseNativeDialog)
+    dialog.fileSelected.emit(str(tmp_path))
+    assert window.input_edit.text() == str(tmp_path)
+    assert window._evidence_dir == tmp_path.resolve()
+
+    dialog.close()
+    window.close()
+    window.deleteLater()
+
+
+def test_text_progress_events_are_coalesced() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    window = PrometheusWindow()
+    window._on_scan_progress({"type": "ufdr-start", "path": "case.ufdr", "textual_total": 10})
+    for index in range(1, 6):
+        window._on_scan_progress({"type": "text-progress", "path": "case.ufdr", "index": index, "total": 10})
+
+    assert window.progress_bar.value() == 0
+    assert window._progress_timer.isActive()
+
+    window._progress_timer.timeout.emit()
+    assert window.progress_bar.value() == 5
+
+    window.close()
+    window.deleteLater()
+
+
+def test_export_worker_copies_pipeline_output(tmp_path: Path) -> None:
+    source = tmp_path / "prometheus_results_20250101_120000.json"
+    source.write_text('[{"match_value": "a@b.c", "context": "linha 1"}]', encoding="utf-8")
+    destination = tmp_path / "export.json"
+
+    gui.ExportWorker([[]] * 5, 1, destination, source).run()
+
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_export_worker_reports_non_os_errors(tmp_path: Path) -> None:
+    # A cell json.dumps cannot encode raises TypeError, not OSError.
+    worker = gui.ExportWorker([[object()], ["Email"], ["a@b.c"], ["x.txt"], [""]], 1, tmp_path / "export.json")
+    errors, finished = [], []
+    worker.signals.error.connect(errors.append)
+    worker.signals.finished.connect(lambda: finished.append(True))
+
+    worker.run()
+
+    assert len(errors) == 1
+    assert finished == [True]
+
+
+def test_scan_worker_uses_streamed_matches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    matches = [
+        EvidenceMatch("a.ufdr", "x.txt", "Email", f"user{index}@example.com", timestamp=None) for index in range(3)
+    ]
+
+    def fake_pipeline(**kwargs):
+        assert kwargs["stream_matches"] is True
+        kwargs["progress_callback"]({"type": "matches", "path": "a.ufdr", "matches": matches})
+        return {"processed": 1, "matches": 3, "failures": [], "output": str(tmp_path / "missing.json")}
+
+    monkeypatch.setattr(main, "run_pipeline", fake_pipeline)
+    monkeypatch.setattr(gui, "RESULT_BATCH_SIZE", 2)
+    batches = []
+
+    worker = gui.ScanWorker(tmp_path, tmp_path / "patterns.json", tmp_path / "results.json")
+    worker.signals.batch_ready.connect(batches.append)
+    worker.run()
+
+    assert [len(batch) for batch in batches] == [3]
+    assert batches[0][0] == ResultRow("a.ufdr", "Email", "user0@example.com", "x.txt", "")
+
+
+def test_validate_inputs_reports_missing_evidence_dir(tmp_path: Path) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    config_path = tmp_path / "patterns.json"
+    config_path.write_text("{}", encoding="utf-8")
+
+    window = PrometheusWindow()
+    window.input_edit.setText(str(tmp_path / "missing"))
+    window.config_edit.setText(str(config_path))
+    with pytest.raises(gui.ScanInputError) as excinfo:
+        window._validate_inputs()
+    assert excinfo.value.title == "Entrada inválida"
+
+    window.input_edit.setText(str(tmp_path))
+    assert window._validate_inputs() == gui.ScanInputs(tmp_path, config_path)
 
     window.close()
     window.deleteLater()
@@ -1,11 +1,18 @@
 """Tests for logging utilities (F9)."""
 
 import logging
+from logging.handlers import QueueHandler
 from pathlib import Path
 
 import pytest
 
-from src.logger import configure_logging, execute_with_resilience, get_logger
+from src.logger import (
+    BufferedFileHandler,
+    BufferedRotatingFileHandler,
+    configure_logging,
+    execute_with_resilience,
+    get_logger,
+)
 
 
 def test_configure_logging_creates_file(tmp_path: Path) -> None:
@@ -19,6 +26,30 @@ def test_configure_logging_creates_file(tmp_path: Path) -> None:
     assert "mensagem de teste" in log_path.read_text(encoding="utf-8")
 
 
+def test_configure_logging_reuses_handlers_for_same_settings(tmp_path: Path) -> None:
+    log_path = tmp_path / "scan.log"
+    logger = configure_logging(verbose=False, log_path=log_path)
+    handlers = list(logger.handlers)
+
+    assert configure_logging(verbose=False, log_path=log_path).handlers == handlers
+    assert configure_logging(verbose=True, log_path=log_path).handlers != handlers
+
+
+def test_configure_logging_writes_through_queue_listener(tmp_path: Path) -> None:
+    logger = configure_logging(verbose=False, log_path=tmp_path / "scan.log")
+    (handler,) = logger.handlers
+
+    assert isinstance(handler, QueueHandler)
+    assert [type(target) for target in handler.listener.handlers] == [
+        BufferedRotatingFileHandler,
+        logging.StreamHandler,
+    ]
+
+    configure_logging(verbose=False, log_path=tmp_path / "other.log")
+
+    assert handler.listener._thread is None
+
+
 def test_execute_with_resilience_logs_errors(tmp_path: Path) -> None:
     configure_logging(verbose=False, log_path=tmp_path / "scan.log")
     logger = get_logger()
@@ -38,3 +69,33 @@ def test_execute_with_resilience_logs_errors(tmp_path: Path) -> None:
     logger.handlers[0].flush()
     log_text = (tmp_path / "scan.log").read_text(encoding="utf-8")
     assert "falha" in log_text
+
+
+def test_configure_logging_without_rotation_uses_plain_file_handler(tmp_path: Path) -> None:
+    logger = configure_logging(verbose=False, log_path=tmp_path / "scan.log", rotate=False)
+
+    file_handler = logger.handlers[0].listener.handlers[0]
+    assert type(file_handler) is BufferedFileHandler
+
+    rotating = configure_logging(verbose=False, log_path=tmp_path / "scan.log", max_bytes=4096, backup_count=2)
+    file_handler = rotating.handlers[0].listener.handlers[0]
+    assert (file_handler.maxBytes, file_handler.backupCount) == (4096, 2)
+
+
+def test_buffered_rotating_handler_defers_writes_and_rotates(tmp_path: Path) -> None:
+    log_path = tmp_path / "scan.log"
+    handler = BufferedRotatingFileHandler(log_path, maxBytes=200, backupCount=1, encoding="utf-8")
+    record = logging.LogRecord("prometheus", logging.INFO, __file__, 1, "x" * 80, None, None)
+
+    handler.emit(record)
+    assert log_path.read_text(encoding="utf-8") == ""
+
+    handler.flush()
+    assert log_path.read_text(encoding="utf-8") == "x" * 80 + "\n"
+
+    handler.emit(record)
+    handler.emit(record)
+    handler.close()
+
+    assert (tmp_path / "scan.log.1").read_text(encoding="utf-8") == ("x" * 80 + "\n") * 2
+    assert log_path.read_text(encoding="utf-8") == "x" * 80 + "\n"
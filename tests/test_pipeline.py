@@ -7,6 +7,7 @@ from zipfile import ZipFile
 import pytest
 
 from src.logger import configure_logging
+from src import main
 from src.main import run_pipeline
 from src.text_extractor import TextExtractionResult
 
@@ -30,6 +31,7 @@ def test_run_pipeline_generates_results(monkeypatch: pytest.MonkeyPatch, tmp_pat
             return TextExtractionResult(text=text, engine="dummy")
 
     monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
 
     input_dir = tmp_path / "evidencias"
     input_dir.mkdir()
@@ -65,3 +67,106 @@ def test_run_pipeline_generates_results(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert log_path.exists()
     log_text = log_path.read_text(encoding="utf-8")
     assert "corrompido.ufdr" in log_text
+
+
+def test_run_pipeline_streams_matches_to_callback(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    class DummyTextExtractor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def extract(self, stream, *, source_name: str) -> TextExtractionResult:
+            return TextExtractionResult(text=stream.read().decode("utf-8"), engine="dummy")
+
+    monkeypatch.setattr("src.content_navigator.TextExtractor", DummyTextExtractor)
+    monkeypatch.setattr("src.content_navigator._shared_text_extractor", None)
+
+    input_dir = tmp_path / "evidencias"
+    input_dir.mkdir()
+    with ZipFile(input_dir / "sample.ufdr", "w") as archive:
+        archive.writestr("reports/report.txt", "Contato: analista@example.com")
+        archive.writestr("reports/vazio.txt", "sem ocorrências")
+
+    config_path = tmp_path / "patterns.json"
+    _write_patterns(config_path)
+    events = []
+
+    summary = run_pipeline(
+        input_dir=input_dir,
+        config_path=config_path,
+        output_path=tmp_path / "outputs" / "prometheus_results.json",
+        progress_callback=events.append,
+        stream_matches=True,
+    )
+
+    streamed = [match for event in events if event["type"] == "matches" for match in event["matches"]]
+    assert [match.match_value for match in streamed] == ["analista@example.com"]
+    assert summary["matches"] == 1
+
+
+def test_run_pipeline_scans_files_in_worker_processes(tmp_path: Path) -> None:
+    input_dir = tmp_path / "evidencias"
+    input_dir.mkdir()
+    for name in ("a", "b", "c"):
+        with ZipFile(input_dir / f"{name}.ufdr", "w") as archive:
+            archive.writestr("notes/contato.txt", f"Contato: {name}@example.com")
+    (input_dir / "corrompido.ufdr").write_bytes(b"not a zip file")
+
+    config_path = tmp_path / "patterns.json"
+    _write_patterns(config_path)
+    log_path = tmp_path / "logs" / "scan.log"
+    configure_logging(verbose=False, log_path=log_path)
+    events = []
+
+    summary = run_pipeline(
+        input_dir=input_dir,
+        config_path=config_path,
+        output_path=tmp_path / "outputs" / "prometheus_results.json",
+        progress_callback=events.append,
+        stream_matches=True,
+        max_workers=2,
+    )
+
+    payload = json.loads(Path(summary["output"]).read_text(encoding="utf-8"))
+    assert sorted(record["match_value"] for record in payload) == ["a@example.com", "b@example.com", "c@example.com"]
+    assert summary["matches"] == 3
+    assert [Path(failure).name for failure in summary["failures"]] == ["corrompido.ufdr"]
+
+    completed = [Path(event["path"]).name for event in events if event["type"] == "ufdr-complete"]
+    assert sorted(completed) == ["a.ufdr", "b.ufdr", "c.ufdr"]
+    assert sum(len(event["matches"]) for event in events if event["type"] == "matches") == 3
+    assert any(event["type"] == "text-progress" for event in events)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_pipeline_keeps_matches_found_before_a_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, max_workers: int
+) -> None:
+    input_dir = tmp_path / "evidencias"
+    input_dir.mkdir()
+    for name in ("a", "b"):
+        with ZipFile(input_dir / f"{name}.ufdr", "w") as archive:
+            archive.writestr("notes/1.txt", f"Contato: {name}@example.com")
+            archive.writestr("notes/2.txt", "falha aqui" if name == "b" else "sem contato")
+    config_path = tmp_path / "patterns.json"
+    _write_patterns(config_path)
+
+    run_regex = main._run_regex
+
+    def failing_run_regex(engine, payload):
+        if payload.internal_path == "notes/2.txt" and payload.content == "falha aqui":
+            raise RuntimeError("leitura interrompida")
+        return run_regex(engine, payload)
+
+    # Pool workers are forked after the patch, so they see it as well.
+    monkeypatch.setattr(main, "_run_regex", failing_run_regex)
+
+    summary = run_pipeline(
+        input_dir=input_dir,
+        config_path=config_path,
+        output_path=tmp_path / "outputs" / "prometheus_results.json",
+        max_workers=max_workers,
+    )
+
+    payload = json.loads(Path(summary["output"]).read_text(encoding="utf-8"))
+    assert sorted(record["match_value"] for record in payload) == ["a@example.com", "b@example.com"]
+    assert [Path(failure).name for failure in summary["failures"]] == ["b.ufdr"]
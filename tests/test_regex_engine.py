@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
 
-from src.regex_engine import RegexEngine
+from src.regex_engine import RegexEngine, RegexPattern
 
 
 def get_config_path() -> Path:
@@ -51,3 +52,29 @@ def test_scan_table_provides_location_metadata() -> None:
     match = matches[0]
     assert match.pattern.name == "Email"
     assert match.location == "row=1;column=colA"
+
+
+def test_scan_table_prefilter_keeps_every_pattern_match() -> None:
+    engine = RegexEngine(
+        [
+            RegexPattern(name="Digitos", expression=r"\d{3}"),
+            RegexPattern(name="Codigo", expression=r"abc\d", flags=re.IGNORECASE),
+        ]
+    )
+
+    matches = engine.scan_table([{"a": "nada aqui"}, {"a": "ABC123"}])
+
+    assert [(match.pattern.name, match.value) for match in matches] == [("Digitos", "123"), ("Codigo", "ABC1")]
+    assert {match.location for match in matches} == {"row=1;column=a"}
+
+
+def test_prefilter_disabled_for_group_references() -> None:
+    engine = RegexEngine(
+        [
+            RegexPattern(name="Repetido", expression=r"(\w)\1"),
+            RegexPattern(name="Digitos", expression=r"\d+"),
+        ]
+    )
+
+    assert engine._prefilter is None
+    assert [match.value for match in engine.scan_table([{"a": "xx"}])] == ["xx"]
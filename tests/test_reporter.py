@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from src.models import EvidenceMatch
 from src.reporter import ResultReporter
 
@@ -55,3 +57,71 @@ def test_reporter_supports_multiple_matches(tmp_path: Path) -> None:
     csv_lines = outputs["csv"].read_text(encoding="utf-8").splitlines()
     assert csv_lines[0].startswith("source_file,internal_path,pattern_type")
     assert len(csv_lines) == len(matches) + 1
+
+
+def test_match_to_dict_keeps_field_order_and_skips_unset_fields() -> None:
+    match = EvidenceMatch(
+        source_file="case.ufdr",
+        internal_path="notes.txt",
+        pattern_type="Email",
+        match_value="a@b.com",
+        timestamp="2024-01-01T00:00:00",
+    )
+
+    assert list(match.to_dict().items()) == [
+        ("source_file", "case.ufdr"),
+        ("internal_path", "notes.txt"),
+        ("pattern_type", "Email"),
+        ("match_value", "a@b.com"),
+        ("timestamp", "2024-01-01T00:00:00"),
+    ]
+    assert not hasattr(match, "__dict__")
+
+
+def test_reporter_streams_matches_once_open(tmp_path: Path) -> None:
+    matches = [
+        EvidenceMatch("a.ufdr", "notes.txt", "Email", "x@y.com", context="linha\n2"),
+        EvidenceMatch("b.ufdr", "db/main.db", "CPF", "123.456.789-00", file_type="database"),
+    ]
+    buffered = ResultReporter(tmp_path / "buffered" / "results.json")
+    buffered.extend_matches(matches)
+    expected = buffered.write()
+
+    reporter = ResultReporter(tmp_path / "streamed" / "results.json")
+    reporter.open()
+    reporter.add_match(matches[0])
+    reporter.extend_matches(matches[1:])
+    assert reporter._matches == []
+    assert reporter.match_count == 2
+    outputs = reporter.write()
+
+    assert outputs["json"].read_text(encoding="utf-8") == expected["json"].read_text(encoding="utf-8")
+    assert outputs["csv"].read_text(encoding="utf-8") == expected["csv"].read_text(encoding="utf-8")
+    assert sorted(path.name for path in outputs["json"].parent.iterdir()) == ["results.csv", "results.json"]
+
+
+def test_reporter_discard_removes_partial_output(tmp_path: Path) -> None:
+    reporter = ResultReporter(tmp_path / "results.json")
+    reporter.open()
+    reporter.write_match(EvidenceMatch("a.ufdr", "notes.txt", "Email", "x@y.com"))
+
+    reporter.discard()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_reporter_refuses_to_overwrite_closed_stream(tmp_path: Path) -> None:
+    reporter = ResultReporter(tmp_path / "results.json")
+    reporter.open()
+    reporter.write_match(EvidenceMatch("a.ufdr", "notes.txt", "Email", "x@y.com"))
+    outputs = reporter.close()
+
+    with pytest.raises(RuntimeError):
+        reporter.write()
+    assert len(json.loads(outputs["json"].read_text(encoding="utf-8"))) == 1
+    assert reporter.match_count == 1
+
+    reporter.clear()
+
+    assert reporter.match_count == 0
+    assert json.loads(reporter.write()["json"].read_text(encoding="utf-8")) == []